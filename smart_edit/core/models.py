@@ -65,7 +65,7 @@ class ExportFormat(Enum):
     JSON = "json"
     TEXT_SCRIPT = "text_script"  # New: Readable text format
 
-@dataclass
+@dataclass(slots=True)
 class VideoFile:
     """Represents a video file in the project"""
     path: str
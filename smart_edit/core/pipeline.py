@@ -321,38 +321,37 @@ class SmartEditPipeline:
     
     def _export_text_script(self, script: GeneratedScript, output_path: str):
         """Export script as readable text"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("Smart Edit Generated Script\n")
-            f.write("=" * 50 + "\n\n")
-            
+        parts = [
+            "Smart Edit Generated Script\n",
+            "=" * 50 + "\n\n",
             # Script metadata
-            f.write(f"Title: {getattr(script, 'title', 'Untitled')}\n")
-            f.write(f"Target Duration: {getattr(script, 'target_duration_minutes', 'N/A')} minutes\n")
-            f.write(f"Estimated Duration: {getattr(script, 'estimated_duration_seconds', 0)/60:.1f} minutes\n")
-            f.write(f"User Prompt: {getattr(script, 'user_prompt', 'None')}\n\n")
-            
-            # Full script text
-            full_text = getattr(script, 'full_text', '')
-            if full_text:
-                f.write("Generated Script:\n")
-                f.write("-" * 20 + "\n")
-                f.write(full_text)
-                f.write("\n\n")
-            
-            # Timeline segments
-            segments = getattr(script, 'segments', [])
-            selected_segments = [s for s in segments if getattr(s, 'keep', True)]
-            
-            f.write("Timeline Segments:\n")
-            f.write("-" * 20 + "\n")
-            
-            for i, segment in enumerate(selected_segments):
-                start_time = getattr(segment, 'start_time', 0)
-                end_time = getattr(segment, 'end_time', 0)
-                content = getattr(segment, 'content', 'No content')
-                video_idx = getattr(segment, 'video_index', 0)
-                
-                f.write(f"{start_time:.2f}s - {end_time:.2f}s [Video {video_idx + 1}]: {content}\n")
+            f"Title: {getattr(script, 'title', 'Untitled')}\n",
+            f"Target Duration: {getattr(script, 'target_duration_minutes', 'N/A')} minutes\n",
+            f"Estimated Duration: {getattr(script, 'estimated_duration_seconds', 0)/60:.1f} minutes\n",
+            f"User Prompt: {getattr(script, 'user_prompt', 'None')}\n\n",
+        ]
+        
+        # Full script text
+        full_text = getattr(script, 'full_text', '')
+        if full_text:
+            parts.append("Generated Script:\n" + "-" * 20 + "\n")
+            parts.append(full_text)
+            parts.append("\n\n")
+        
+        # Timeline segments
+        segments = getattr(script, 'segments', [])
+        selected_segments = [s for s in segments if getattr(s, 'keep', True)]
+        
+        parts.append("Timeline Segments:\n" + "-" * 20 + "\n")
+        parts.extend(
+            f"{getattr(segment, 'start_time', 0):.2f}s - {getattr(segment, 'end_time', 0):.2f}s "
+            f"[Video {getattr(segment, 'video_index', 0) + 1}]: {getattr(segment, 'content', 'No content')}\n"
+            for segment in selected_segments
+        )
+        
+        # Single write instead of one per line
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
     
     def _export_json_script(self, script: GeneratedScript, output_path: str):
         """Export script as JSON data"""
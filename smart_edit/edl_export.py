@@ -8,6 +8,8 @@ describes edit decisions with timecodes and source references.
 
 import os
 import logging
+import functools
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Union, Dict, Optional
 from datetime import timedelta
@@ -29,9 +31,18 @@ except ImportError:
         class ScriptSegment:
             pass
 
+# Segment timing, read in one call per edit
+_segment_times = attrgetter('start_time', 'end_time')
+
+# Edit entry: event line (number, reel, source in/out, record in/out) followed by its clip name comment
+_EDL_EVENT_TEMPLATE = "%s  %-8s AA/V  C        %s %s %s %s \n* FROM CLIP NAME: %s"
+
 class EDLExporter:
     """EDL exporter for generated scripts"""
     
+    # Output is written through a buffer this large (bytes)
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     def __init__(self, fps: int = 24):
         """
         Initialize EDL exporter
@@ -96,8 +107,11 @@ class EDLExporter:
         segments = []
         for seg in script.segments:
             if getattr(seg, 'keep', True):  # Default to True if no keep attribute
-                start = getattr(seg, 'start_time', 0.0)
-                end = getattr(seg, 'end_time', 0.0)
+                # _segment_times reads both attributes, so segments missing either are dropped
+                if not (hasattr(seg, 'start_time') and hasattr(seg, 'end_time')):
+                    logger.warning("Skipping segment without start/end time")
+                    continue
+                start, end = _segment_times(seg)
                 
                 # Validate timing - reduced minimum duration to 1 frame
                 min_duration = 1.0 / self.fps  # 1 frame duration
@@ -108,7 +122,8 @@ class EDLExporter:
         
         if not segments and script.segments:
             logger.warning("No segments marked to keep, using all segments")
-            segments = script.segments
+            segments = [seg for seg in script.segments
+                        if hasattr(seg, 'start_time') and hasattr(seg, 'end_time')]
         
         return segments
     
@@ -124,14 +139,19 @@ class EDLExporter:
         
         # Track timeline position
         timeline_position = 0.0
+        to_timecode = self._seconds_to_timecode
+        clamped_count = 0
+        
+        # Reel and clip names depend only on the video - work them out once per video
+        reel_names = [self._sanitize_reel_name(Path(path).stem) for path in video_paths]
+        clip_names = self._clip_names(video_paths, custom_clip_names)
         
         # Generate edit entries
         for i, segment in enumerate(segments):
             edit_number = f"{i+1:03d}"  # 001, 002, etc.
             
             # Get segment timing
-            source_start = getattr(segment, 'start_time', 0.0)
-            source_end = getattr(segment, 'end_time', source_start + 1.0)
+            source_start, source_end = _segment_times(segment)
             duration = source_end - source_start
             
             # Get video index for source reference
@@ -139,34 +159,28 @@ class EDLExporter:
             
             # Ensure video index is within range
             if video_index >= len(video_paths):
-                logger.warning(f"Video index {video_index} out of range, using 0")
+                clamped_count += 1
                 video_index = 0
             
             # Get source file name and make it EDL-compliant
-            source_reel = self._sanitize_reel_name(Path(video_paths[video_index]).stem)
+            source_reel = reel_names[video_index]
             
             # Calculate timeline positions
             timeline_start = timeline_position
             timeline_end = timeline_position + duration
             
             # Convert to timecode
-            source_tc_in = self._seconds_to_timecode(source_start)
-            source_tc_out = self._seconds_to_timecode(source_end)
-            timeline_tc_in = self._seconds_to_timecode(timeline_start)
-            timeline_tc_out = self._seconds_to_timecode(timeline_end)
+            source_tc_in = to_timecode(source_start)
+            source_tc_out = to_timecode(source_end)
+            timeline_tc_in = to_timecode(timeline_start)
+            timeline_tc_out = to_timecode(timeline_end)
             
-            # Get clip name - use custom name if available, otherwise original filename
-            if custom_clip_names and video_index in custom_clip_names:
-                clip_name = custom_clip_names[video_index]
-            else:
-                clip_name = Path(video_paths[video_index]).name
+            clip_name = clip_names[video_index]
             
             # EDL edit entry format matching your sample:
             # Uses AA/V for combined audio/video track like professional EDLs
-            edl_lines.extend([
-                f"{edit_number}  {source_reel:<8} AA/V  C        {source_tc_in} {source_tc_out} {timeline_tc_in} {timeline_tc_out} ",
-                f"* FROM CLIP NAME: {clip_name}",
-            ])
+            edl_lines.append(_EDL_EVENT_TEMPLATE % (
+                edit_number, source_reel, source_tc_in, source_tc_out, timeline_tc_in, timeline_tc_out, clip_name))
             
             # Add segment content as comment if available
             content = getattr(segment, 'content', '')
@@ -180,8 +194,16 @@ class EDLExporter:
             # Update timeline position
             timeline_position = timeline_end
         
+        if clamped_count:
+            logger.warning("%d segment(s) had a video index out of range, using 0", clamped_count)
+        
         return "\n".join(edl_lines)
     
+    def _clip_names(self, video_paths: List[str], custom_clip_names: Optional[Dict[int, str]] = None) -> List[str]:
+        """Clip name per video - custom name if available, otherwise original filename"""
+        custom_clip_names = custom_clip_names or {}
+        return [custom_clip_names.get(index, Path(path).name) for index, path in enumerate(video_paths)]
+    
     def _sanitize_reel_name(self, filename: str) -> str:
         """Sanitize filename for EDL reel name (max 8 chars, alphanumeric)"""
         
@@ -245,8 +267,11 @@ class EDLExporter:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(edl_content)
+            # Encode once and write the bytes directly; line endings follow the platform as in text mode
+            if os.linesep != "\n":
+                edl_content = edl_content.replace("\n", os.linesep)
+            with open(output_file, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                f.write(edl_content.encode('utf-8'))
                 
         except Exception as e:
             logger.error(f"Failed to save EDL file: {e}")
@@ -266,13 +291,21 @@ class CMX3600EDLExporter(EDLExporter):
         ]
         
         timeline_position = 0.0
+        to_timecode = self._seconds_to_timecode
+        
+        # Create proper reel names (2 chars like AX, BX, etc.)
+        if len(video_paths) == 1:
+            reel_names = ["AX"]  # Single source like your sample
+        else:
+            # Multiple sources: AX, BX, CX, etc.
+            reel_names = [f"{chr(65 + index)}X" for index in range(len(video_paths))]
+        clip_names = self._clip_names(video_paths, custom_clip_names)
         
         for i, segment in enumerate(segments):
             edit_number = f"{i+1:03d}"
             
             # Get timing
-            source_start = getattr(segment, 'start_time', 0.0)
-            source_end = getattr(segment, 'end_time', source_start + 1.0)
+            source_start, source_end = _segment_times(segment)
             duration = source_end - source_start
             
             # Get source
@@ -280,40 +313,33 @@ class CMX3600EDLExporter(EDLExporter):
             if video_index >= len(video_paths):
                 video_index = 0
             
-            # Create proper reel name (2 chars like AX, BX, etc.)
-            if len(video_paths) == 1:
-                source_reel = "AX"  # Single source like your sample
-            else:
-                # Multiple sources: AX, BX, CX, etc.
-                reel_letter = chr(65 + video_index)  # A, B, C, etc.
-                source_reel = f"{reel_letter}X"
+            source_reel = reel_names[video_index]
             
             # Timeline positions
             timeline_start = timeline_position
             timeline_end = timeline_position + duration
             
             # Timecodes
-            source_tc_in = self._seconds_to_timecode(source_start)
-            source_tc_out = self._seconds_to_timecode(source_end)
-            timeline_tc_in = self._seconds_to_timecode(timeline_start)
-            timeline_tc_out = self._seconds_to_timecode(timeline_end)
+            source_tc_in = to_timecode(source_start)
+            source_tc_out = to_timecode(source_end)
+            timeline_tc_in = to_timecode(timeline_start)
+            timeline_tc_out = to_timecode(timeline_end)
             
-            # Get clip name - use custom name if available, otherwise original filename
-            if custom_clip_names and video_index in custom_clip_names:
-                clip_name = custom_clip_names[video_index]
-            else:
-                clip_name = Path(video_paths[video_index]).name
+            clip_name = clip_names[video_index]
             
             # CMX 3600 format with AA/V track (combined audio/video)
-            edl_lines.extend([
-                f"{edit_number}  {source_reel:<8} AA/V  C        {source_tc_in} {source_tc_out} {timeline_tc_in} {timeline_tc_out} ",
-                f"* FROM CLIP NAME: {clip_name}",
-            ])
+            edl_lines.append(_EDL_EVENT_TEMPLATE % (
+                edit_number, source_reel, source_tc_in, source_tc_out, timeline_tc_in, timeline_tc_out, clip_name))
             
             timeline_position = timeline_end
         
         return "\n".join(edl_lines)
 
+@functools.lru_cache(maxsize=8)
+def _get_exporter(fps: int, cmx3600: bool) -> EDLExporter:
+    """Shared exporter per frame rate and format variant"""
+    return CMX3600EDLExporter(fps=fps) if cmx3600 else EDLExporter(fps=fps)
+
 # Convenience function
 def export_script_to_edl(script: GeneratedScript, video_paths: Union[str, List[str]], 
                         output_path: str, fps: int = 24, sequence_name: str = "SmartEdit",
@@ -333,11 +359,7 @@ def export_script_to_edl(script: GeneratedScript, video_paths: Union[str, List[s
     Returns:
         bool: True if successful, False otherwise
     """
-    if edl_format.lower() == "cmx3600":
-        exporter = CMX3600EDLExporter(fps=fps)
-    else:
-        exporter = EDLExporter(fps=fps)
-    
+    exporter = _get_exporter(fps, edl_format.lower() == "cmx3600")
     return exporter.export_script(script, video_paths, output_path, sequence_name, custom_clip_names)
 
 # Example usage and format documentation
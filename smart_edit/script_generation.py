@@ -45,7 +45,10 @@ except ImportError:
             metadata: Dict[str, Any]
             full_text: str = ""
 
-@dataclass
+# Filler words dropped by the fallback generator
+FILLER_WORDS = frozenset({'um', 'uh'})
+
+@dataclass(slots=True)
 class ScriptSegment:
     start_time: float
     end_time: float  
@@ -233,7 +236,7 @@ SCRIPT: [cleaned version of actual transcript content only]"""
             if line and not line.startswith('[Video'):
                 # Remove excessive filler
                 words = line.split()
-                clean_words = [w for w in words if w.lower() not in ['um', 'uh'] * 5]
+                clean_words = [w for w in words if w.lower() not in FILLER_WORDS]
                 if clean_words:
                     clean_lines.append(' '.join(clean_words))
         
@@ -10,6 +10,7 @@ import time
 import tempfile
 import subprocess
 import logging
+import threading
 from typing import List, Dict, Union, Optional, Any
 from pathlib import Path
 from dataclasses import dataclass, asdict
@@ -87,10 +88,27 @@ class TranscriptionConfig:
             return "cpu"
         return device
 
+# Whisper models loaded so far, keyed by (model_size, device), each with a lock that
+# serializes inference on it. Loading once per process avoids N concurrent loads (and
+# checkpoint downloads) when several videos are transcribed in parallel; Whisper's
+# decoder installs temporary hooks on the model, so inference on one model must not overlap.
+_MODELS: Dict[tuple, tuple] = {}
+_MODELS_LOCK = threading.Lock()
+
+def _get_shared_model(model_size: str, device: str):
+    """Load (or reuse) the Whisper model for model_size/device; returns (model, inference_lock)"""
+    key = (model_size, device)
+    with _MODELS_LOCK:
+        if key not in _MODELS:
+            logger.info(f"Loading Whisper {model_size} on {device}")
+            _MODELS[key] = (whisper.load_model(model_size, device=device), threading.Lock())
+        return _MODELS[key]
+
 class SmartTranscriber:
     def __init__(self, config: Optional[TranscriptionConfig] = None):
         self.config = config or TranscriptionConfig()
         self.model = None
+        self._inference_lock = None
         self._validate_dependencies()
         self._load_model()
     
@@ -107,10 +125,9 @@ class SmartTranscriber:
             )
     
     def _load_model(self):
-        """Load Whisper model"""
+        """Load Whisper model (shared with other transcribers using the same size and device)"""
         try:
-            logger.info(f"Loading Whisper {self.config.model_size} on {self.config.device}")
-            self.model = whisper.load_model(self.config.model_size, device=self.config.device)
+            self.model, self._inference_lock = _get_shared_model(self.config.model_size, self.config.device)
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
@@ -181,9 +198,10 @@ class SmartTranscriber:
     
     def _extract_audio(self, video_path: str) -> str:
         """Extract audio to temporary WAV file"""
-        temp_dir = tempfile.gettempdir()
         video_name = Path(video_path).stem
-        audio_path = os.path.join(temp_dir, f"{video_name}_audio_{int(time.time())}.wav")
+        # Unique per call - cameras often share file names (C0001.MP4) across folders
+        fd, audio_path = tempfile.mkstemp(prefix=f"{video_name}_audio_", suffix=".wav")
+        os.close(fd)
         
         logger.info(f"Extracting audio from: {Path(video_path).name}")
         
@@ -204,8 +222,13 @@ class SmartTranscriber:
             logger.info(f"Audio extracted: {audio_size / (1024*1024):.1f}MB")
             return audio_path
             
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"FFmpeg failed: {e.stderr}")
+        except Exception as e:
+            # The temp file exists from mkstemp even when extraction fails
+            if os.path.exists(audio_path):
+                os.remove(audio_path)
+            if isinstance(e, subprocess.CalledProcessError):
+                raise RuntimeError(f"FFmpeg failed: {e.stderr}")
+            raise
     
     def _transcribe_audio(self, video_path: str) -> Dict:
         """Extract audio and transcribe"""
@@ -221,7 +244,8 @@ class SmartTranscriber:
             }
             
             logger.info(f"Transcribing: {Path(audio_path).name}")
-            return self.model.transcribe(audio_path, **options)
+            with self._inference_lock:
+                return self.model.transcribe(audio_path, **options)
             
         finally:
             if audio_path and os.path.exists(audio_path):
@@ -0,0 +1,97 @@
+"""
+Smart Edit Background Jobs
+
+Thread pool shared by the UI windows for long-running work (transcription,
+script generation, import warm-up). Workers are daemon threads, so closing
+the app never waits for a job that is still running.
+"""
+
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from functools import lru_cache
+
+# Threads shared by all background jobs (transcription runs, script generation, import warm-up)
+BACKGROUND_WORKERS = 2
+
+class DaemonThreadPoolExecutor(Executor):
+    """
+    Minimal thread pool whose workers are daemon threads
+
+    concurrent.futures.ThreadPoolExecutor joins its (non-daemon) workers at interpreter
+    exit, so a transcription still running when the window closes would keep the process
+    alive until it finished. These workers are simply dropped at exit instead.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker"):
+        self._max_workers = max(1, max_workers)
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue = queue.SimpleQueue()
+        self._threads = []
+        self._idle = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            future = Future()
+            self._work_queue.put((future, fn, args, kwargs))
+
+            # Start another worker only when none is free to take the job
+            if self._idle == 0 and len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._worker, daemon=True,
+                                          name=f"{self._thread_name_prefix}_{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._idle = max(0, self._idle - 1)
+        return future
+
+    def _worker(self):
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+            with self._lock:
+                self._idle += 1
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+
+            if cancel_futures:
+                # Drop jobs that have not started yet
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+
+            # One stop marker per worker, queued behind any remaining jobs
+            for _ in self._threads:
+                self._work_queue.put(None)
+            threads = list(self._threads)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+@lru_cache(maxsize=None)
+def shared_executor() -> DaemonThreadPoolExecutor:
+    """The app-wide pool for background jobs, created on first use"""
+    return DaemonThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="smart-edit")
@@ -7,9 +7,18 @@ Exports to EDL format with streamlined code and maintained functionality.
 
 import os
 import sys
+import time
+import queue
+import pickle
+import hashlib
 import threading
 import logging
+import importlib.util
+from concurrent.futures import CancelledError, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -20,25 +29,95 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
-try:
-    from transcription import transcribe_video
-    from ui.script_editor import show_script_editor
-    from edl_export import export_script_to_edl
-    EDL_EXPORT_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Import error - {e}")
-    EDL_EXPORT_AVAILABLE = False
+from ui.background import DaemonThreadPoolExecutor, shared_executor
+
+# Transcription, script generation and EDL export pull in Whisper/torch and OpenAI,
+# so they are imported on first use (or by a warm-up thread) rather than at startup.
+# This only finds the module file - the export falls back to text if the import itself fails
+EDL_EXPORT_AVAILABLE = importlib.util.find_spec("edl_export") is not None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _transcription_api():
+    """Import the transcription entry points on first use"""
+    from transcription import transcribe_video, TranscriptionConfig
+    return transcribe_video, TranscriptionConfig
+
+@lru_cache(maxsize=None)
+def _script_editor_api():
+    """Import the script editor on first use"""
+    from ui.script_editor import show_script_editor
+    return show_script_editor
+
+@lru_cache(maxsize=None)
+def _edl_export_api():
+    """Import the EDL exporter on first use"""
+    from edl_export import export_script_to_edl
+    return export_script_to_edl
+
+def _warm_up_imports():
+    """Import the heavy modules in the background so the first click doesn't stall"""
+    for loader in (_transcription_api, _script_editor_api, _edl_export_api):
+        try:
+            loader()
+        except ImportError as e:
+            logger.warning(f"Import error - {e}")
+
+@dataclass
+class ScriptView:
+    """Column view of the kept segments of a generated script, built once per script"""
+    start_times: List[float] = field(default_factory=list)
+    end_times: List[float] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    video_indices: List[int] = field(default_factory=list)
+    
+    def __len__(self):
+        return len(self.start_times)
+
+def _build_script_view(script) -> ScriptView:
+    """Collect the kept segments of script in a single pass"""
+    view = ScriptView()
+    # Segments always define these fields, so read them directly
+    for segment in getattr(script, 'segments', []):
+        if not segment.keep:
+            continue
+        view.start_times.append(segment.start_time)
+        view.end_times.append(segment.end_time)
+        view.contents.append(segment.content)
+        view.video_indices.append(segment.video_index)
+    return view
+
 class SmartEditMainWindow:
     """Main application window for Smart Edit"""
     
     # Supported video formats
     VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
     
+    # Videos processed at once (override with SMART_EDIT_TRANSCRIBE_WORKERS). All workers share
+    # one Whisper model and take turns on it, so two is enough to extract the next video's audio
+    # while the current one is transcribed; 1 transcribes strictly one video at a time
+    MAX_TRANSCRIPTION_WORKERS = 2
+    
+    # Oldest log lines are dropped beyond this many
+    MAX_LOG_LINES = 2000
+    
+    # How often (ms) events queued by worker threads are pumped into the UI,
+    # and how long (s) a single pump may run before yielding to Tk
+    UI_PUMP_INTERVAL_MS = 50
+    UI_PUMP_BUDGET = 0.005
+    
+    # Whisper model used for transcription (part of the transcript cache key)
+    TRANSCRIPTION_MODEL = "base"
+    
+    # Transcripts are cached here, keyed by file path, size, mtime and model
+    TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "smart_edit" / "transcripts"
+    
+    # Write buffer size for text exports
+    EXPORT_BUFFER_SIZE = 1 << 20
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Smart Edit - AI Video Editor")
@@ -48,13 +127,50 @@ class SmartEditMainWindow:
         self.video_files = []
         self.transcription_results = []
         self.generated_script = None
-        self.processing_thread = None
+        self._script_view = None  # ScriptView of generated_script
+        self._current_future = None  # Future of the running transcription job
         self.project_name = "Untitled Project"
         self.custom_clip_names = {}  # Store custom clip names
         self.clip_name_entries = []  # Store UI entry widgets
+        self._results_lines = []  # Lines currently shown in the results display
+        self._log_line_count = 0  # Lines currently in the log display
+        self._ui_queue = queue.SimpleQueue()  # (event, *payload) tuples from worker threads
+        self.max_transcription_workers = self._get_transcription_workers()
+        self._executor = shared_executor()
+        self._closing = threading.Event()  # Set when the window closes; stops pending transcriptions
+        
+        # Resolve the export backend once instead of re-checking on every export
+        if EDL_EXPORT_AVAILABLE:
+            self._do_export = self._do_edl_export
+            self._export_filetypes = [("EDL files", "*.edl"), ("All files", "*.*")]
+            self._export_extension = ".edl"
+            self._export_label = "📤 Export EDL"
+        else:
+            self._use_text_export()
         
         self._setup_ui()
         self.update_status("Ready - Load video files to begin")
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._executor.submit(_warm_up_imports)
+        if EDL_EXPORT_AVAILABLE:
+            self._executor.submit(self._check_edl_export)
+    
+    def _check_edl_export(self):
+        """Switch to text export if the EDL exporter is present but won't import"""
+        try:
+            _edl_export_api()
+        except ImportError:
+            self._ui_queue.put(("edl_unavailable",))
+    
+    def _use_text_export(self):
+        """Export plain text instead of EDL"""
+        self._do_export = self._do_text_export
+        self._export_filetypes = [("Text files", "*.txt"), ("All files", "*.*")]
+        self._export_extension = ".txt"
+        self._export_label = "📤 Export Text"
+        if hasattr(self, 'export_button'):
+            self.export_button.config(text=self._export_label)
     
     def _setup_ui(self):
         """Set up the main user interface"""
@@ -127,7 +243,11 @@ class SmartEditMainWindow:
         ttk.Label(left_frame, text="Processing:", font=("Arial", 10, "bold")).grid(row=7, column=0, sticky=tk.W, pady=(0, 5))
         
         self.transcribe_button = ttk.Button(left_frame, text="🎤 Transcribe", command=self.start_transcription)
-        self.transcribe_button.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 3))
+        self.transcribe_button.grid(row=8, column=0, sticky=(tk.W, tk.E), pady=(0, 3))
+        
+        self.force_transcribe_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left_frame, text="Force re-transcribe", variable=self.force_transcribe_var).grid(
+            row=8, column=1, sticky=tk.W, padx=(5, 0), pady=(0, 3))
         
         self.script_button = ttk.Button(left_frame, text="📝 Script", command=self.open_script_generator, state=tk.DISABLED)
         self.script_button.grid(row=9, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
@@ -140,8 +260,7 @@ class SmartEditMainWindow:
         ttk.Separator(left_frame, orient='horizontal').grid(row=11, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=8)
         ttk.Label(left_frame, text="Export:", font=("Arial", 10, "bold")).grid(row=12, column=0, sticky=tk.W, pady=(0, 5))
         
-        export_text = "📤 Export EDL" if EDL_EXPORT_AVAILABLE else "📤 Export Text"
-        self.export_button = ttk.Button(left_frame, text=export_text, command=self.export_edl, state=tk.DISABLED)
+        self.export_button = ttk.Button(left_frame, text=self._export_label, command=self.export_edl, state=tk.DISABLED)
         self.export_button.grid(row=13, column=0, columnspan=2, sticky=(tk.W, tk.E))
     
     def _setup_clip_names_section(self, parent):
@@ -231,6 +350,14 @@ class SmartEditMainWindow:
         self.log_text = ScrolledText(right_frame, height=6, width=50, state=tk.DISABLED)
         self.log_text.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
+    def _get_transcription_workers(self):
+        """Read the transcription pool size from the environment"""
+        try:
+            workers = int(os.getenv('SMART_EDIT_TRANSCRIBE_WORKERS', self.MAX_TRANSCRIPTION_WORKERS))
+        except ValueError:
+            workers = self.MAX_TRANSCRIPTION_WORKERS
+        return max(1, workers)
+    
     def _on_project_name_change(self, *args):
         """Handle project name changes"""
         self.project_name = self.project_name_var.get() or "Untitled Project"
@@ -263,11 +390,12 @@ class SmartEditMainWindow:
         filetypes = [("Video files", "*.mp4 *.avi *.mov *.mkv *.wmv *.flv *.webm"), ("All files", "*.*")]
         files = filedialog.askopenfilenames(title="Select Video Files", filetypes=filetypes)
         
-        added_count = 0
+        added_names = []
         invalid_files = []
+        known_files = set(self.video_files)
         
         for file_path in files:
-            if file_path in self.video_files:
+            if file_path in known_files:
                 continue
                 
             # Validate video file
@@ -276,9 +404,13 @@ class SmartEditMainWindow:
                 continue
             
             self.video_files.append(file_path)
-            filename = os.path.basename(file_path)
-            self.file_listbox.insert(tk.END, filename)  # Simplified - just filename
-            added_count += 1
+            known_files.add(file_path)
+            added_names.append(os.path.basename(file_path))  # Simplified - just filename
+        
+        # Insert all new rows in one call so the listbox redraws once
+        added_count = len(added_names)
+        if added_names:
+            self.file_listbox.insert(tk.END, *added_names)
         
         # Update clip names UI
         self._update_clip_names_ui()
@@ -348,13 +480,12 @@ class SmartEditMainWindow:
         """Reset all processing state"""
         self.transcription_results.clear()
         self.generated_script = None
+        self._script_view = None
         self.script_button.config(state=tk.DISABLED)
         self.export_button.config(state=tk.DISABLED)
         
         # Clear results display
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.config(state=tk.DISABLED)
+        self._set_results_text([])
     
     def start_transcription(self):
         """Start the video transcription process"""
@@ -362,19 +493,20 @@ class SmartEditMainWindow:
             messagebox.showwarning("No Videos", "Please add video files before transcription.")
             return
         
-        if self.processing_thread and self.processing_thread.is_alive():
+        if self._current_future and not self._current_future.done():
             messagebox.showwarning("Processing", "Transcription is already in progress.")
             return
         
         # Reset state
         self.transcription_results.clear()
         self.generated_script = None
+        self._script_view = None
         self.script_button.config(state=tk.DISABLED)
         self.export_button.config(state=tk.DISABLED)
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._transcribe_videos, daemon=True)
-        self.processing_thread.start()
+        force = self.force_transcribe_var.get()
+        self._current_future = self._executor.submit(self._transcribe_videos, force)
         
         # Update UI
         self.transcribe_button.config(state=tk.DISABLED)
@@ -382,32 +514,97 @@ class SmartEditMainWindow:
         self.update_status("Transcribing videos...")
         self.log_message("🎤 Starting video transcription...")
     
-    def _transcribe_videos(self):
-        """Transcribe videos in background thread"""
+    def _transcript_cache_key(self, video_path):
+        """Stable fingerprint of a video file and the model used to transcribe it"""
+        stat = os.stat(video_path)
+        fingerprint = f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}|{self.TRANSCRIPTION_MODEL}"
+        return hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=20).hexdigest()
+    
+    def _cached_transcribe(self, video_path, force=False):
+        """
+        Transcribe a video, reusing a cached transcript when the file is unchanged
+        
+        Returns:
+            Tuple of (TranscriptionResult, cache_hit)
+        """
+        cache_path = self.TRANSCRIPT_CACHE_DIR / f"{self._transcript_cache_key(video_path)}.pkl"
+        
+        if not force and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f), True
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable transcript cache {cache_path.name}: {e}")
+        
+        transcribe_video, TranscriptionConfig = _transcription_api()
+        config = TranscriptionConfig(model_size=self.TRANSCRIPTION_MODEL)
+        result = transcribe_video(video_path, config)
+        
+        # Write to a temp file and swap it in so a crash never leaves a partial entry
         try:
-            for i, video_path in enumerate(self.video_files):
-                video_name = os.path.basename(video_path)
-                
-                # Update progress
-                self.root.after(0, lambda name=video_name, idx=i+1, total=len(self.video_files): 
-                              self.log_message(f"🎤 Transcribing {idx}/{total}: {name}"))
-                
-                # Transcribe video
-                result = transcribe_video(video_path)
-                self.transcription_results.append(result)
-                
-                # Update completion
-                duration_mins = result.metadata.get('total_duration', 0) / 60
-                segment_count = len(result.segments)
+            self.TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not cache transcript for {os.path.basename(video_path)}: {e}")
+        
+        return result, False
+    
+    def _transcribe_unless_closing(self, video_path, i, total, force=False):
+        """Transcribe one video unless the window has closed while it was queued"""
+        if self._closing.is_set():
+            raise CancelledError()
+        # Logged when a worker picks the video up, not when it is queued
+        self._ui_queue.put(("log", f"🎤 Transcribing {i+1}/{total}: {os.path.basename(video_path)}"))
+        return self._cached_transcribe(video_path, force)
+    
+    def _transcribe_videos(self, force=False):
+        """Transcribe videos in background thread, several files at a time"""
+        video_files = list(self.video_files)
+        total = len(video_files)
+        results = [None] * total
+        workers = min(total, self.max_transcription_workers)
+        cache_hits = 0
+        
+        try:
+            with DaemonThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcribe") as pool:
+                futures = {}
+                for i, video_path in enumerate(video_files):
+                    future = pool.submit(self._transcribe_unless_closing, video_path, i, total, force)
+                    futures[future] = (i, os.path.basename(video_path))
                 
-                self.root.after(0, lambda name=video_name, duration=duration_mins, segments=segment_count:
-                              self.log_message(f"✅ Completed: {name} ({duration:.1f}min, {segments} segments)"))
-            
-            self.root.after(0, self._transcription_complete)
-            
+                try:
+                    for future in as_completed(futures):
+                        if self._closing.is_set():
+                            raise CancelledError()
+                        i, video_name = futures[future]
+                        result, cache_hit = future.result()
+                        cache_hits += cache_hit
+                        # Keep submission order so results line up with video_index
+                        results[i] = result
+                        
+                        duration_mins = result.metadata.get('total_duration', 0) / 60
+                        segment_count = len(result.segments)
+                        
+                        source = " [cached]" if cache_hit else ""
+                        self._ui_queue.put(("log", f"✅ Completed: {video_name} ({duration_mins:.1f}min, "
+                                            f"{segment_count} segments){source}"))
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            
+            self.transcription_results.extend(results)
+            self._ui_queue.put(("log", f"💾 Transcript cache: {cache_hits} hit(s), {total - cache_hits} miss(es)"))
+            self._ui_queue.put(("transcription_complete",))
+            
+        except CancelledError:
+            # Window closed mid-run
+            return
         except Exception as e:
-            self.root.after(0, lambda: self._handle_error("Transcription", e))
-            self.root.after(0, self._transcription_failed)
+            self._ui_queue.put(("transcription_failed", e))
     
     def _transcription_complete(self):
         """Handle successful transcription completion"""
@@ -462,14 +659,38 @@ class SmartEditMainWindow:
             ])
             
             # Update display
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(1.0, "\n".join(results_lines))
-            self.results_text.config(state=tk.DISABLED)
+            self._set_results_text(results_lines)
             
         except Exception as e:
             self.log_message(f"⚠️ Error updating results: {e}")
     
+    def _set_results_text(self, results_lines):
+        """Show results_lines in the results display, rewriting only the lines that changed"""
+        new_lines = "\n".join(results_lines).split("\n") if results_lines else []
+        old_lines = self._results_lines
+        if new_lines == old_lines:
+            return
+        
+        # Keep the unchanged leading lines and replace everything after them
+        prefix = 0
+        for old_line, new_line in zip(old_lines, new_lines):
+            if old_line != new_line:
+                break
+            prefix += 1
+        tail = new_lines[prefix:]
+        
+        self.results_text.config(state=tk.NORMAL)
+        if prefix:
+            self.results_text.delete(f"{prefix}.end", tk.END)
+            if tail:
+                self.results_text.insert(tk.END, "\n" + "\n".join(tail))
+        else:
+            self.results_text.delete(1.0, tk.END)
+            self.results_text.insert(1.0, "\n".join(tail))
+        self.results_text.config(state=tk.DISABLED)
+        
+        self._results_lines = new_lines
+    
     def open_script_generator(self):
         """Open the script generator/editor window"""
         if not self.transcription_results:
@@ -479,6 +700,7 @@ class SmartEditMainWindow:
         try:
             self.log_message("📝 Opening script generator...")
             
+            show_script_editor = _script_editor_api()
             final_script = show_script_editor(
                 parent=self.root,
                 transcriptions=self.transcription_results,
@@ -487,6 +709,7 @@ class SmartEditMainWindow:
             
             if final_script:
                 self.generated_script = final_script
+                self._script_view = _build_script_view(final_script)
                 self.log_message("✅ Script generation completed!")
                 self._update_script_results()
                 self.export_button.config(state=tk.NORMAL)
@@ -503,14 +726,14 @@ class SmartEditMainWindow:
             return
         
         try:
-            segments = getattr(self.generated_script, 'segments', [])
-            selected_segments = [s for s in segments if getattr(s, 'keep', True)]
+            view = self._script_view
+            selected_count = len(view)
             
             results_lines = [
                 "=== SCRIPT GENERATED ===\n",
                 f"Title: {getattr(self.generated_script, 'title', 'Untitled')}",
                 f"Duration: {getattr(self.generated_script, 'estimated_duration_seconds', 0)/60:.1f} minutes",
-                f"Segments: {len(selected_segments)} selected",
+                f"Segments: {selected_count} selected",
                 ""
             ]
             
@@ -525,17 +748,14 @@ class SmartEditMainWindow:
             
             # Sample segments
             results_lines.append("📋 Selected segments:")
-            for i, segment in enumerate(selected_segments[:5]):
-                start_time = getattr(segment, 'start_time', 0)
-                content = getattr(segment, 'content', 'No content')
-                video_idx = getattr(segment, 'video_index', 0)
-                
-                video_indicator = f"[V{video_idx + 1}]" if len(self.transcription_results) > 1 else ""
+            multi_video = len(self.transcription_results) > 1
+            for start_time, content, video_idx in zip(view.start_times[:5], view.contents[:5], view.video_indices[:5]):
+                video_indicator = f"[V{video_idx + 1}]" if multi_video else ""
                 content_preview = content if len(content) <= 50 else content[:47] + "..."
                 results_lines.append(f"  {start_time:.1f}s {video_indicator}: {content_preview}")
             
-            if len(selected_segments) > 5:
-                results_lines.append(f"  ... and {len(selected_segments) - 5} more")
+            if selected_count > 5:
+                results_lines.append(f"  ... and {selected_count - 5} more")
             
             results_lines.extend([
                 "",
@@ -543,10 +763,7 @@ class SmartEditMainWindow:
             ])
             
             # Update display
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(1.0, "\n".join(results_lines))
-            self.results_text.config(state=tk.DISABLED)
+            self._set_results_text(results_lines)
             
         except Exception as e:
             self.log_message(f"⚠️ Error updating results: {e}")
@@ -557,90 +774,147 @@ class SmartEditMainWindow:
             messagebox.showwarning("No Script", "Please create a script first.")
             return
         
-        # Get output path
-        if EDL_EXPORT_AVAILABLE:
-            filetypes = [("EDL files", "*.edl"), ("All files", "*.*")]
-            default_name = f"{self.project_name}.edl"
-        else:
-            filetypes = [("Text files", "*.txt"), ("All files", "*.*")]
-            default_name = f"{self.project_name}.txt"
-        
         output_path = filedialog.asksaveasfilename(
             title="Save Export File",
-            initialfile=default_name,
-            filetypes=filetypes
+            initialfile=f"{self.project_name}{self._export_extension}",
+            filetypes=self._export_filetypes
         )
         
         if not output_path:
             return
         
         try:
-            if EDL_EXPORT_AVAILABLE:
-                self.log_message("📤 Exporting EDL...")
-                success = export_script_to_edl(
-                    script=self.generated_script,
-                    video_paths=self.video_files,
-                    output_path=output_path,
-                    sequence_name=os.path.splitext(os.path.basename(output_path))[0],
-                    custom_clip_names=self.custom_clip_names
-                )
-                
-                if success:
-                    self.log_message(f"✅ EDL exported: {os.path.basename(output_path)}")
-                    messagebox.showinfo("Export Complete", f"EDL file exported successfully!\n{output_path}")
-                else:
-                    self.log_message("❌ EDL export failed")
-                    messagebox.showerror("Export Failed", "EDL export failed. Check logs for details.")
-            else:
-                # Fallback to text export
-                self.log_message("📤 Exporting text...")
-                self._export_text_representation(output_path)
-                self.log_message(f"✅ Text exported: {os.path.basename(output_path)}")
-                messagebox.showinfo("Export Complete", f"Text file exported successfully!\n{output_path}")
-                
+            self._do_export(output_path)
         except Exception as e:
             self._handle_error("Export", e)
     
+    def _do_edl_export(self, output_path):
+        """Export the generated script as an EDL file"""
+        try:
+            export_script_to_edl = _edl_export_api()
+        except ImportError as e:
+            logger.warning(f"EDL export unavailable - {e}")
+            self.log_message("⚠️ EDL export unavailable - exporting text instead")
+            self._use_text_export()
+            self._do_text_export(os.path.splitext(output_path)[0] + self._export_extension)
+            return
+        
+        self.log_message("📤 Exporting EDL...")
+        success = export_script_to_edl(
+            script=self.generated_script,
+            video_paths=self.video_files,
+            output_path=output_path,
+            sequence_name=os.path.splitext(os.path.basename(output_path))[0],
+            custom_clip_names=self.custom_clip_names
+        )
+        
+        if success:
+            self.log_message(f"✅ EDL exported: {os.path.basename(output_path)}")
+            messagebox.showinfo("Export Complete", f"EDL file exported successfully!\n{output_path}")
+        else:
+            self.log_message("❌ EDL export failed")
+            messagebox.showerror("Export Failed", "EDL export failed. Check logs for details.")
+    
+    def _do_text_export(self, output_path):
+        """Fallback export as plain text when EDL export is unavailable"""
+        self.log_message("📤 Exporting text...")
+        self._export_text_representation(output_path)
+        self.log_message(f"✅ Text exported: {os.path.basename(output_path)}")
+        messagebox.showinfo("Export Complete", f"Text file exported successfully!\n{output_path}")
+    
     def _export_text_representation(self, output_path):
         """Export script as text representation - simplified"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"Smart Edit Project: {self.project_name}\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Video files
-            f.write(f"Videos ({len(self.video_files)}):\n")
-            for i, video_path in enumerate(self.video_files):
-                f.write(f"  {i+1}. {os.path.basename(video_path)}\n")
-            
-            # User prompt
-            user_prompt = getattr(self.generated_script, 'user_prompt', '')
-            if user_prompt:
-                f.write(f"\nInstructions:\n{user_prompt}\n\n")
-            
-            # Timeline segments
-            f.write("Timeline:\n" + "-" * 20 + "\n")
-            segments = getattr(self.generated_script, 'segments', [])
-            selected_segments = [s for s in segments if getattr(s, 'keep', True)]
-            
-            for i, segment in enumerate(selected_segments):
-                start_time = getattr(segment, 'start_time', 0)
-                end_time = getattr(segment, 'end_time', 0)
-                content = getattr(segment, 'content', 'No content')
-                video_idx = getattr(segment, 'video_index', 0)
-                
-                f.write(f"{i+1}. {start_time:.2f}s-{end_time:.2f}s [Video {video_idx + 1}]: {content}\n")
+        parts = [
+            f"Smart Edit Project: {self.project_name}\n",
+            "=" * 50 + "\n\n",
+            f"Videos ({len(self.video_files)}):\n",
+        ]
+        
+        # Video files
+        parts.extend(f"  {i}. {os.path.basename(video_path)}\n"
+                     for i, video_path in enumerate(self.video_files, 1))
+        
+        # User prompt
+        user_prompt = getattr(self.generated_script, 'user_prompt', '')
+        if user_prompt:
+            parts.append(f"\nInstructions:\n{user_prompt}\n\n")
+        
+        # Timeline segments
+        parts.append("Timeline:\n" + "-" * 20 + "\n")
+        view = self._script_view or _build_script_view(self.generated_script)
+        parts.extend(
+            f"{i}. {start_time:.2f}s-{end_time:.2f}s [Video {video_idx + 1}]: {content}\n"
+            for i, (start_time, end_time, video_idx, content) in enumerate(
+                zip(view.start_times, view.end_times, view.video_indices, view.contents), 1)
+        )
+        
+        # Single write through a large buffer
+        with open(output_path, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+            f.write("".join(parts))
     
     def log_message(self, message):
         """Add a message to the log display"""
+        self._append_log([message])
+    
+    def _append_log(self, messages):
+        """Append messages to the log display, trimming it to MAX_LOG_LINES"""
+        text = "\n".join(messages)
         try:
             self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, f"{message}\n")
+            self.log_text.insert(tk.END, f"{text}\n")
+            self._log_line_count += text.count("\n") + 1
+            
+            # Drop the oldest lines in a single delete once over the cap
+            excess = self._log_line_count - self.MAX_LOG_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+                self._log_line_count -= excess
+            
             self.log_text.see(tk.END)
             self.log_text.config(state=tk.DISABLED)
-            logger.info(message)
         except tk.TclError:
             # Widget might be destroyed
             pass
+        
+        for message in messages:
+            logger.info(message)
+    
+    def _pump_events(self):
+        """Dispatch events queued by worker threads, within a small time budget, then reschedule"""
+        deadline = time.perf_counter() + self.UI_PUMP_BUDGET
+        pending_logs = []
+        
+        while time.perf_counter() < deadline:
+            try:
+                event, *payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            # Consecutive log lines are written to the log display in one update
+            if event == "log":
+                pending_logs.append(payload[0])
+                continue
+            
+            if pending_logs:
+                self._append_log(pending_logs)
+                pending_logs = []
+            
+            if event == "transcription_complete":
+                self._transcription_complete()
+            elif event == "transcription_failed":
+                self._handle_error("Transcription", payload[0])
+                self._transcription_failed()
+            elif event == "edl_unavailable":
+                self._use_text_export()
+        
+        if pending_logs:
+            self._append_log(pending_logs)
+        
+        try:
+            self.root.after(self.UI_PUMP_INTERVAL_MS, self._pump_events)
+        except tk.TclError:
+            # Window closed
+            pass
     
     def update_status(self, message):
         """Update the status bar"""
@@ -650,8 +924,19 @@ class SmartEditMainWindow:
             # Widget might be destroyed
             pass
     
+    def _on_close(self):
+        """Stop background work and close the window"""
+        # Queued videos are skipped; one already transcribing runs on a daemon thread
+        # and does not keep the process alive after the window is gone.
+        # The pool is shared with other windows, so only this window's job is cancelled
+        self._closing.set()
+        if self._current_future:
+            self._current_future.cancel()
+        self.root.destroy()
+    
     def run(self):
         """Start the application"""
+        self.root.after(self.UI_PUMP_INTERVAL_MS, self._pump_events)
         self.root.mainloop()
 
 def main():
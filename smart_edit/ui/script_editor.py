@@ -12,13 +12,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from typing import List, Optional, Dict, Any
 import copy
-import threading
+from dataclasses import is_dataclass, replace
 
 # Add parent directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
+from ui.background import shared_executor
+
 try:
     from script_generation import GeneratedScript, ScriptSegment, generate_script_from_prompt
     from transcription import TranscriptionResult
@@ -57,6 +59,9 @@ except ImportError:
         def generate_script_from_prompt(*args, **kwargs):
             raise NotImplementedError("Script generation not available in development mode")
 
+# Checkbox column text for kept / dropped segments
+CHECKBOX_TEXT = {True: "✓", False: ""}
+
 class PromptScriptEditorWindow:
     """Interactive prompt-driven script editor"""
     
@@ -73,8 +78,15 @@ class PromptScriptEditorWindow:
         self.modified_script: Optional[GeneratedScript] = None
         self.is_generating = False
         self.script_modified = False
-        self.generation_thread = None  # Track background thread
+        self.generation_future = None  # Track background job
         self.window_closed = False  # Track window state
+        self._segment_keep: List[bool] = []  # Checkbox state per segment, mirrors segments_tree (iid = str(index))
+        self._timeline_previews: List[str] = []  # Timeline text per segment, formatted once per script
+        self._durations: List[float] = []  # end_time - start_time per segment
+        self._selected_count = 0  # Number of checked segments
+        self._timeline_refresh_pending = False  # Coalesces timeline refreshes into one per idle
+        self._timeline_dirty = False  # Timeline changed while its tab was hidden
+        self._timeline_signature = None  # Checkbox state the timeline text was last rendered from
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -111,6 +123,9 @@ class PromptScriptEditorWindow:
         self.notebook.add(self.timeline_frame, text="3. Timeline Review")
         self._setup_timeline_tab()
         
+        # Redraw a stale timeline when its tab is shown
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
         # Initially disable editor tabs
         self.notebook.tab(1, state="disabled")
         self.notebook.tab(2, state="disabled")
@@ -234,7 +249,7 @@ class PromptScriptEditorWindow:
                                         show="tree headings")
         
         # Configure columns - removed "video" column since no multicam
-        self.segments_tree.heading("#0", text="✓")
+        self.segments_tree.heading("#0", text=CHECKBOX_TEXT[True])
         self.segments_tree.heading("time", text="Time")
         self.segments_tree.heading("content", text="Content")
         
@@ -329,15 +344,18 @@ class PromptScriptEditorWindow:
     def _on_segment_click(self, event):
         """Handle segment tree clicks (toggle checkboxes)"""
         item = self.segments_tree.identify_row(event.y)
-        if item and self.segments_tree.identify_column(event.x) == "#0":
-            # Toggle checkbox
-            current_text = self.segments_tree.item(item, "text")
-            if current_text == "✓":
-                self.segments_tree.item(item, text="")
-            else:
-                self.segments_tree.item(item, text="✓")
-            
-            self._update_timeline_preview()
+        index = self._segment_index(item)
+        if index is not None and self.segments_tree.identify_column(event.x) == "#0":
+            # Toggle checkbox - only this row changes
+            self._set_segments_keep([index], not self._segment_keep[index])
+    
+    def _segment_index(self, item: str) -> Optional[int]:
+        """Segment index of a segments_tree item (rows use the index as their iid)"""
+        try:
+            return int(item)
+        except ValueError:
+            # Placeholder row or no row
+            return None
     
     def generate_script(self):
         """Generate script from user prompt"""
@@ -379,13 +397,12 @@ class PromptScriptEditorWindow:
                 if not self.window_closed:
                     self.window.after(0, self._on_script_error, str(e))
         
-        self.generation_thread = threading.Thread(target=generate_thread, daemon=True)
-        self.generation_thread.start()
+        self.generation_future = shared_executor().submit(generate_thread)
     
     def _on_script_generated(self, script: GeneratedScript):
         """Handle successful script generation"""
         self.generated_script = script
-        self.modified_script = copy.deepcopy(script)
+        self.modified_script = self._clone_script(script)
         self.script_modified = False
         
         # Hide progress
@@ -412,6 +429,16 @@ class PromptScriptEditorWindow:
                            f"• {len(script.segments)} segments selected\n"
                            f"• Estimated duration: {script.estimated_duration_seconds/60:.1f} minutes")
     
+    def _clone_script(self, script: GeneratedScript) -> GeneratedScript:
+        """Copy a script for editing - new segment objects and metadata, shared scalars"""
+        if not is_dataclass(script):
+            # Development fallback classes
+            return copy.deepcopy(script)
+        
+        return replace(script,
+                       segments=[replace(segment) for segment in script.segments],
+                       metadata=dict(script.metadata))
+    
     def _on_script_error(self, error_message: str):
         """Handle script generation error"""
         # Hide progress
@@ -468,9 +495,13 @@ class PromptScriptEditorWindow:
         if not self.generated_script or not hasattr(self.generated_script, 'segments'):
             return
         
-        # Clear existing items
-        for item in self.segments_tree.get_children():
-            self.segments_tree.delete(item)
+        # Clear existing items in a single call
+        self.segments_tree.delete(*self.segments_tree.get_children())
+        self._segment_keep = []
+        self._timeline_previews = []
+        self._durations = []
+        self._timeline_signature = None
+        self._selected_count = 0
         
         # Validate segments
         segments = getattr(self.generated_script, 'segments', [])
@@ -486,77 +517,124 @@ class PromptScriptEditorWindow:
         for i, segment in enumerate(segments):
             try:
                 # Format time with error handling
-                start_time = getattr(segment, 'start_time', 0.0)
+                start_time = segment.start_time
                 time_str = f"{start_time:.1f}s"
                 
-                # Content preview with error handling
-                content = getattr(segment, 'content', 'No content')
+                # Content previews with error handling
+                content = segment.content
                 content_preview = content[:60] + "..." if len(content) > 60 else content
+                timeline_preview = content[:70] + "..." if len(content) > 70 else content
+                duration = segment.end_time - start_time
                 
                 # Insert with checkbox
-                keep = getattr(segment, 'keep', True)
-                checkbox_text = "✓" if keep else ""
+                keep = segment.keep
+                checkbox_text = CHECKBOX_TEXT[bool(keep)]
                 
-                self.segments_tree.insert("", tk.END, 
+                self.segments_tree.insert("", tk.END, iid=str(i),
                                         text=checkbox_text,
                                         values=(time_str, content_preview),
                                         tags=(f"segment_{i}",))
                 
             except Exception as e:
                 # Add error item
-                self.segments_tree.insert("", tk.END, 
+                keep = False
+                time_str, content_preview, timeline_preview = "ERR", f"Error loading segment {i}: {e}", ""
+                duration = 0.0
+                self.segments_tree.insert("", tk.END, iid=str(i),
                                         text="",
-                                        values=("ERR", f"Error loading segment {i}: {e}"),
+                                        values=(time_str, content_preview),
                                         tags=(f"error_{i}",))
+            
+            self._segment_keep.append(bool(keep))
+            self._timeline_previews.append(timeline_preview)
+            self._durations.append(duration)
+            if keep:
+                self._selected_count += 1
     
     def _select_all_segments(self):
         """Select all segments"""
-        for item in self.segments_tree.get_children():
-            self.segments_tree.item(item, text="✓")
-        self._update_timeline_preview()
+        self._set_segments_keep(range(len(self._segment_keep)), True)
     
     def _deselect_all_segments(self):
         """Deselect all segments"""
-        for item in self.segments_tree.get_children():
-            self.segments_tree.item(item, text="")
-        self._update_timeline_preview()
+        self._set_segments_keep(range(len(self._segment_keep)), False)
+    
+    def _set_segments_keep(self, indices, keep: bool):
+        """Set the checkbox state of several segments, updating only rows that change"""
+        checkbox_text = CHECKBOX_TEXT[keep]
+        for index in indices:
+            if self._segment_keep[index] == keep:
+                continue
+            
+            self._segment_keep[index] = keep
+            self.segments_tree.item(str(index), text=checkbox_text)
+            
+            self._selected_count += 1 if keep else -1
+        
+        self._request_timeline_refresh()
+    
+    def _request_timeline_refresh(self):
+        """Schedule a timeline refresh - rapid toggles in one Tk turn redraw it once"""
+        if not self._timeline_refresh_pending:
+            self._timeline_refresh_pending = True
+            self.window.after_idle(self._flush_timeline_refresh)
+    
+    def _flush_timeline_refresh(self):
+        """Run a scheduled timeline refresh"""
+        self._timeline_refresh_pending = False
+        try:
+            self._update_timeline_preview()
+        except tk.TclError:
+            # Window closed before the refresh ran
+            pass
+    
+    def _on_tab_changed(self, event):
+        """Bring the timeline up to date when its tab becomes visible"""
+        if self._timeline_dirty:
+            self._update_timeline_preview()
     
     def _update_timeline_preview(self):
         """Update the timeline preview"""
         if not self.generated_script:
             return
         
-        timeline_lines = []
-        timeline_lines.append("=== FINAL TIMELINE PREVIEW ===\n")
-        timeline_lines.append(f"Project: {self.generated_script.title}")
-        timeline_lines.append("")
+        # Defer the redraw until the timeline tab is shown
+        if self.notebook.select() != str(self.timeline_frame):
+            self._timeline_dirty = True
+            return
+        self._timeline_dirty = False
+        
+        # Skip the rebuild if the selection hasn't changed since the last render
+        signature = tuple(self._segment_keep)
+        if signature == self._timeline_signature:
+            return
+        self._timeline_signature = signature
         
-        # Get selected segments
-        selected_segments = []
-        for i, item in enumerate(self.segments_tree.get_children()):
-            if self.segments_tree.item(item, "text") == "✓":
-                if i < len(self.generated_script.segments):
-                    selected_segments.append(self.generated_script.segments[i])
+        timeline_lines = [f"=== FINAL TIMELINE PREVIEW ===\n\nProject: {self.generated_script.title}\n"]
         
-        if not selected_segments:
+        # Walk the checkbox state instead of querying every tree row
+        if not self._selected_count:
             timeline_lines.append("No segments selected for final timeline.")
         else:
             current_time = 0.0
             
-            for i, segment in enumerate(selected_segments):
-                duration = segment.end_time - segment.start_time
+            for i, keep in enumerate(self._segment_keep):
+                if not keep:
+                    continue
+                duration = self._durations[i]
                 
                 # Timeline entry - removed video indicator since no multicam
                 timeline_lines.append(
                     f"{current_time:6.1f}s - {current_time + duration:6.1f}s: "
-                    f"{segment.content[:70]}{'...' if len(segment.content) > 70 else ''}"
+                    f"{self._timeline_previews[i]}"
                 )
                 
                 current_time += duration
             
-            timeline_lines.append("")
-            timeline_lines.append(f"Total Duration: {current_time:.1f} seconds ({current_time/60:.1f} minutes)")
-            timeline_lines.append(f"Selected Segments: {len(selected_segments)} of {len(self.generated_script.segments)}")
+            timeline_lines.append(
+                f"\nTotal Duration: {current_time:.1f} seconds ({current_time/60:.1f} minutes)\n"
+                f"Selected Segments: {self._selected_count} of {len(self.generated_script.segments)}"
+            )
         
         # Update timeline display
         self.timeline_text.config(state=tk.NORMAL)
@@ -584,9 +662,8 @@ class PromptScriptEditorWindow:
         self.modified_script.full_text = current_text
         
         # Update segment selections
-        for i, item in enumerate(self.segments_tree.get_children()):
-            if i < len(self.modified_script.segments):
-                self.modified_script.segments[i].keep = (self.segments_tree.item(item, "text") == "✓")
+        for segment, keep in zip(self.modified_script.segments, self._segment_keep):
+            segment.keep = keep
         
         # Store the result
         self.final_script = self.modified_script
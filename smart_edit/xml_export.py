@@ -12,10 +12,20 @@ Fixes:
 """
 
 import os
+import re
 import logging
+import functools
+import contextlib
+import threading
+import gzip
+import hashlib
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Union, Dict, Optional
+from typing import List, Union, Dict, Optional, Tuple
 import uuid
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,195 +44,53 @@ except ImportError:
         class ScriptSegment:
             pass
 
-class XMLExporter:
-    """Enhanced XML exporter with video groups support and better Premiere Pro compatibility"""
-    
-    def __init__(self, fps: int = 24, width: int = 1920, height: int = 1080):
-        self.fps = fps
-        self.width = width
-        self.height = height
-        # Use TRUE for NTSC even with 24fps (matches Premiere behavior)
-        self.ntsc = "TRUE" if fps in [24, 30, 60] else "FALSE"
-    
-    def export_script(self, script: GeneratedScript, video_paths: Union[str, List[str]], 
-                     output_path: str, sequence_name: str = "SmartEdit_Timeline", 
-                     video_groups: Optional[Dict[str, List[str]]] = None) -> bool:
-        """
-        Export script to XML with video groups support
-        
-        Args:
-            script: Generated script with segments
-            video_paths: List of video file paths
-            output_path: Output XML file path
-            sequence_name: Name for the sequence
-            video_groups: Dictionary mapping group names to video paths
-                         e.g., {"Single": [path1], "Multicam A": [path2, path3]}
-        """
-        try:
-            # Convert single path to list
-            if isinstance(video_paths, str):
-                video_paths = [video_paths]
-            
-            # Validate inputs
-            if not video_paths:
-                raise ValueError("No video paths provided")
-            
-            # Get segments to export
-            segments = self._get_valid_segments(script)
-            if not segments:
-                raise ValueError("No valid segments to export")
-            
-            logger.info(f"Exporting {len(segments)} segments from {len(video_paths)} video(s)")
-            
-            # If no groups provided, create default grouping
-            if video_groups is None:
-                if len(video_paths) == 1:
-                    video_groups = {"Single": video_paths}
-                else:
-                    video_groups = {"Multicam A": video_paths}
-                    
-            # Log grouping information
-            for group_name, paths in video_groups.items():
-                logger.info(f"Group '{group_name}': {len(paths)} video(s)")
-            
-            # Generate XML based on grouping
-            xml_content = self._create_grouped_xml(segments, video_groups, sequence_name)
-            
-            # Save to file
-            self._save_xml(xml_content, output_path)
-            logger.info(f"✅ XML exported to: {output_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ XML export failed: {e}")
-            return False
-    
-    def _create_grouped_xml(self, segments: List[ScriptSegment], video_groups: Dict[str, List[str]], 
-                           sequence_name: str) -> str:
-        """Create XML with proper group handling"""
-        
-        # Determine the export strategy
-        multicam_groups = {k: v for k, v in video_groups.items() if len(v) > 1}
-        single_videos = []
-        for group_name, paths in video_groups.items():
-            if len(paths) == 1:
-                single_videos.extend(paths)
-        
-        if len(multicam_groups) == 1 and not single_videos:
-            # Pure multicam case
-            group_name, video_paths = next(iter(multicam_groups.items()))
-            logger.info(f"Creating pure multicam XML for group: {group_name}")
-            return self._create_multicam_xml(segments, video_paths, f"{sequence_name}_{group_name}")
-            
-        elif len(multicam_groups) == 0 and len(single_videos) == 1:
-            # Pure single cam case
-            logger.info("Creating single cam XML")
-            return self._create_single_cam_xml(segments, single_videos[0], sequence_name)
-            
-        else:
-            # Mixed case - create combined timeline
-            logger.info("Creating mixed timeline with multiple groups")
-            return self._create_mixed_xml(segments, video_groups, sequence_name)
-    
-    def _create_mixed_xml(self, segments: List[ScriptSegment], video_groups: Dict[str, List[str]], 
-                         sequence_name: str) -> str:
-        """Create XML for mixed single and multicam clips"""
-        
-        # For now, flatten all videos into one timeline
-        # This is a simplified approach - full implementation would create 
-        # multicam source clips for grouped videos
-        all_videos = []
-        for group_name, paths in video_groups.items():
-            all_videos.extend(paths)
-        
-        if len(all_videos) == 1:
-            return self._create_single_cam_xml(segments, all_videos[0], sequence_name)
-        else:
-            # Create a basic multicam structure with all videos
-            return self._create_multicam_xml(segments, all_videos, sequence_name)
-    
-    def _get_valid_segments(self, script: GeneratedScript) -> List[ScriptSegment]:
-        """Extract valid segments from script"""
-        
-        if not hasattr(script, 'segments'):
-            logger.error("Script has no segments attribute")
-            return []
-        
-        # Get segments marked to keep
-        segments = []
-        for seg in script.segments:
-            if getattr(seg, 'keep', True):  # Default to True if no keep attribute
-                start = getattr(seg, 'start_time', 0.0)
-                end = getattr(seg, 'end_time', 0.0)
-                
-                # Validate timing
-                if end > start and (end - start) > 0.1:  # At least 0.1 second
-                    segments.append(seg)
-                else:
-                    logger.warning(f"Skipping segment with invalid timing: {start}s to {end}s")
-        
-        if not segments and script.segments:
-            logger.warning("No segments marked to keep, using all segments")
-            segments = script.segments
-        
-        return segments
-    
-    def _create_single_cam_xml(self, segments: List[ScriptSegment], video_path: str, sequence_name: str) -> str:
-        """Generate single camera XML with proper Premiere compatibility"""
-        
-        # Prepare video file info
-        video_file = Path(video_path)
-        if not video_file.exists():
-            logger.warning(f"Video file not found: {video_path}")
-        
-        file_uri = video_file.absolute().as_uri()
-        file_name = video_file.name  # Use full filename with extension
-        file_stem = video_file.stem   # Use stem for clip names
-        
-        # Generate unique IDs
-        sequence_uuid = str(uuid.uuid4())
-        
-        # Calculate total source duration (assuming it's longer than our edit)
-        max_source_time = 0
-        for segment in segments:
-            end_time = getattr(segment, 'end_time', 0.0)
-            max_source_time = max(max_source_time, end_time)
-        
-        source_duration_frames = int((max_source_time + 300) * self.fps)  # Add 5 min buffer
-        
-        # Generate clips
-        video_clips = ""
-        audio_clips = ""
-        timeline_position = 0
-        
-        for i, segment in enumerate(segments):
-            start_time = getattr(segment, 'start_time', 0.0)
-            end_time = getattr(segment, 'end_time', start_time + 1.0)
-            
-            # Convert to frames
-            source_in_frames = int(start_time * self.fps)
-            source_out_frames = int(end_time * self.fps)
-            duration_frames = source_out_frames - source_in_frames
-            
-            if duration_frames <= 0:
-                continue
-            
-            # Video clip with proper structure
-            video_clips += f"""
-          <clipitem id="clipitem-{i+1}">
+@functools.lru_cache(maxsize=128)
+def _resolve_video(video_path: str) -> Tuple[str, str, str]:
+    """XML-escaped (file URI, file name, file stem) for a video path, memoized per process"""
+    video_file = Path(video_path)
+    return (escape(video_file.absolute().as_uri()),
+            escape(video_file.name),
+            escape(video_file.stem))
+
+@dataclass(frozen=True)
+class _VideoSource:
+    """A video path resolved once per export: escaped URI, name and stem, and whether it exists"""
+    path: str
+    uri: str
+    name: str
+    stem: str
+    exists: bool
+
+def _video_source(video_path: str) -> _VideoSource:
+    return _VideoSource(video_path, *_resolve_video(video_path), os.path.exists(video_path))
+
+# Sequence UUIDs in a cached export - replaced with fresh ones on every cache hit
+_SEQUENCE_UUID = re.compile(rb"<uuid>[^<]*</uuid>")
+
+def _fresh_uuid(match: re.Match) -> bytes:
+    return f"<uuid>{uuid.uuid4()}</uuid>".encode('ascii')
+
+# XML templates. {fps}, {ntsc}, {width} and {height} are baked in per exporter by
+# XMLExporter._bake_template; the remaining fields are filled with str.format.
+# The *_TAIL strings have no per-clip fields and are appended as-is.
+
+# Single cam: one video clip on the sequence track
+_SINGLE_VIDEO_CLIP_TEMPLATE = """
+          <clipitem id="clipitem-{n}">
             <masterclipid>masterclip-1</masterclipid>
-            <name>Segment_{i+1}</name>
+            <name>Segment_{n}</name>
             <enabled>TRUE</enabled>
-            <duration>{duration_frames}</duration>
+            <duration>{duration}</duration>
             <rate>
-              <timebase>{self.fps}</timebase>
-              <ntsc>{self.ntsc}</ntsc>
+              <timebase>{fps}</timebase>
+              <ntsc>{ntsc}</ntsc>
             </rate>
-            <start>{timeline_position}</start>
-            <end>{timeline_position + duration_frames}</end>
-            <in>{source_in_frames}</in>
-            <out>{source_out_frames}</out>
-            <file id="file-1"/>
+            <start>{start}</start>
+            <end>{end}</end>
+            <in>{source_in}</in>
+            <out>{source_out}</out>
+            <file id="file-1"/>"""
+_SINGLE_VIDEO_CLIP_TAIL = """
             <sourcetrack>
               <mediatype>video</mediatype>
               <trackindex>1</trackindex>
@@ -244,23 +112,24 @@ class XMLExporter:
               <lut2></lut2>
             </colorinfo>
           </clipitem>"""
-            
-            # Audio clip with proper channel routing
-            audio_clips += f"""
-          <clipitem id="audioclip-{i+1}">
+
+# Single cam: one audio clip on the sequence track
+_SINGLE_AUDIO_CLIP_TEMPLATE = """
+          <clipitem id="audioclip-{n}">
             <masterclipid>masterclip-1</masterclipid>
-            <name>Audio_{i+1}</name>
+            <name>Audio_{n}</name>
             <enabled>TRUE</enabled>
-            <duration>{duration_frames}</duration>
+            <duration>{duration}</duration>
             <rate>
-              <timebase>{self.fps}</timebase>
-              <ntsc>{self.ntsc}</ntsc>
+              <timebase>{fps}</timebase>
+              <ntsc>{ntsc}</ntsc>
             </rate>
-            <start>{timeline_position}</start>
-            <end>{timeline_position + duration_frames}</end>
-            <in>{source_in_frames}</in>
-            <out>{source_out_frames}</out>
-            <file id="file-1"/>
+            <start>{start}</start>
+            <end>{end}</end>
+            <in>{source_in}</in>
+            <out>{source_out}</out>
+            <file id="file-1"/>"""
+_SINGLE_AUDIO_CLIP_TAIL = """
             <sourcetrack>
               <mediatype>audio</mediatype>
               <trackindex>1</trackindex>
@@ -275,14 +144,9 @@ class XMLExporter:
               <originalaudiofilename></originalaudiofilename>
             </logginginfo>
           </clipitem>"""
-            
-            timeline_position += duration_frames
-        
-        # Total sequence duration
-        total_duration = timeline_position
-        
-        # Create the complete XML structure
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
+
+# Single cam: document up to the video clips
+_SINGLE_CAM_HEAD_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE xmeml>
 <xmeml version="4">
   <project>
@@ -290,10 +154,10 @@ class XMLExporter:
     <children>
       <clip id="masterclip-1">
         <name>{file_stem}</name>
-        <duration>{source_duration_frames}</duration>
+        <duration>{source_duration}</duration>
         <rate>
-          <timebase>{self.fps}</timebase>
-          <ntsc>{self.ntsc}</ntsc>
+          <timebase>{fps}</timebase>
+          <ntsc>{ntsc}</ntsc>
         </rate>
         <media>
           <video>
@@ -301,27 +165,27 @@ class XMLExporter:
               <clipitem id="masterclip-video-1">
                 <name>{file_stem}</name>
                 <enabled>TRUE</enabled>
-                <duration>{source_duration_frames}</duration>
+                <duration>{source_duration}</duration>
                 <rate>
-                  <timebase>{self.fps}</timebase>
-                  <ntsc>{self.ntsc}</ntsc>
+                  <timebase>{fps}</timebase>
+                  <ntsc>{ntsc}</ntsc>
                 </rate>
                 <start>0</start>
-                <end>{source_duration_frames}</end>
+                <end>{source_duration}</end>
                 <in>0</in>
-                <out>{source_duration_frames}</out>
+                <out>{source_duration}</out>
                 <file id="file-1">
                   <name>{file_name}</name>
                   <pathurl>{file_uri}</pathurl>
                   <rate>
-                    <timebase>{self.fps}</timebase>
-                    <ntsc>{self.ntsc}</ntsc>
+                    <timebase>{fps}</timebase>
+                    <ntsc>{ntsc}</ntsc>
                   </rate>
-                  <duration>{source_duration_frames}</duration>
+                  <duration>{source_duration}</duration>
                   <timecode>
                     <rate>
-                      <timebase>{self.fps}</timebase>
-                      <ntsc>{self.ntsc}</ntsc>
+                      <timebase>{fps}</timebase>
+                      <ntsc>{ntsc}</ntsc>
                     </rate>
                     <string>00:00:00:00</string>
                     <frame>0</frame>
@@ -331,11 +195,11 @@ class XMLExporter:
                     <video>
                       <samplecharacteristics>
                         <rate>
-                          <timebase>{self.fps}</timebase>
-                          <ntsc>{self.ntsc}</ntsc>
+                          <timebase>{fps}</timebase>
+                          <ntsc>{ntsc}</ntsc>
                         </rate>
-                        <width>{self.width}</width>
-                        <height>{self.height}</height>
+                        <width>{width}</width>
+                        <height>{height}</height>
                         <anamorphic>FALSE</anamorphic>
                         <pixelaspectratio>square</pixelaspectratio>
                         <fielddominance>none</fielddominance>
@@ -374,15 +238,15 @@ class XMLExporter:
               <clipitem id="masterclip-audio-1">
                 <name>{file_stem}</name>
                 <enabled>TRUE</enabled>
-                <duration>{source_duration_frames}</duration>
+                <duration>{source_duration}</duration>
                 <rate>
-                  <timebase>{self.fps}</timebase>
-                  <ntsc>{self.ntsc}</ntsc>
+                  <timebase>{fps}</timebase>
+                  <ntsc>{ntsc}</ntsc>
                 </rate>
                 <start>0</start>
-                <end>{source_duration_frames}</end>
+                <end>{source_duration}</end>
                 <in>0</in>
-                <out>{source_duration_frames}</out>
+                <out>{source_duration}</out>
                 <file id="file-1"/>
                 <sourcetrack>
                   <mediatype>audio</mediatype>
@@ -406,8 +270,8 @@ class XMLExporter:
         <uuid>{sequence_uuid}</uuid>
         <duration>{total_duration}</duration>
         <rate>
-          <timebase>{self.fps}</timebase>
-          <ntsc>{self.ntsc}</ntsc>
+          <timebase>{fps}</timebase>
+          <ntsc>{ntsc}</ntsc>
         </rate>
         <name>{sequence_name}</name>
         <media>
@@ -415,11 +279,11 @@ class XMLExporter:
             <format>
               <samplecharacteristics>
                 <rate>
-                  <timebase>{self.fps}</timebase>
-                  <ntsc>{self.ntsc}</ntsc>
+                  <timebase>{fps}</timebase>
+                  <ntsc>{ntsc}</ntsc>
                 </rate>
-                <width>{self.width}</width>
-                <height>{self.height}</height>
+                <width>{width}</width>
+                <height>{height}</height>
                 <anamorphic>FALSE</anamorphic>
                 <pixelaspectratio>square</pixelaspectratio>
                 <fielddominance>none</fielddominance>
@@ -428,7 +292,10 @@ class XMLExporter:
             </format>
             <track>
               <enabled>TRUE</enabled>
-              <locked>FALSE</locked>{video_clips}
+              <locked>FALSE</locked>"""
+
+# Single cam: between the video and audio clips
+_SINGLE_CAM_MIDDLE_TEMPLATE = """
             </track>
           </video>
           <audio>
@@ -460,14 +327,17 @@ class XMLExporter:
             <track>
               <enabled>TRUE</enabled>
               <locked>FALSE</locked>
-              <outputchannelindex>1</outputchannelindex>{audio_clips}
+              <outputchannelindex>1</outputchannelindex>"""
+
+# Single cam: after the audio clips
+_SINGLE_CAM_TAIL_TEMPLATE = """
             </track>
           </audio>
         </media>
         <timecode>
           <rate>
-            <timebase>{self.fps}</timebase>
-            <ntsc>{self.ntsc}</ntsc>
+            <timebase>{fps}</timebase>
+            <ntsc>{ntsc}</ntsc>
           </rate>
           <string>00:00:00:00</string>
           <frame>0</frame>
@@ -486,47 +356,23 @@ class XMLExporter:
     </children>
   </project>
 </xmeml>"""
-    
-    def _create_multicam_xml(self, segments: List[ScriptSegment], video_paths: List[str], sequence_name: str) -> str:
-      """Generate multicam XML with cuts based on script segments"""
-    
-      logger.info(f"Creating multicam XML with {len(video_paths)} cameras and {len(segments)} cut segments")
-      
-      try:
-          # Calculate source duration
-          max_source_time = 0
-          for segment in segments:
-              end_time = getattr(segment, 'end_time', 0.0)
-              max_source_time = max(max_source_time, end_time)
-          
-          source_duration_frames = int((max_source_time + 300) * self.fps)  # Add 5 min buffer
-          sequence_uuid = str(uuid.uuid4())
-          
-          # Create file definitions for all cameras
-          file_definitions = ""
-          for i, video_path in enumerate(video_paths):
-              try:
-                  video_file = Path(video_path)
-                  if not video_file.exists():
-                      logger.warning(f"Video file not found: {video_path}")
-                      continue
-                      
-                  file_uri = video_file.absolute().as_uri()
-                  file_name = video_file.name
-                  
-                  file_definitions += f"""
-        <file id="file-{i+1}">
+
+# Multicam: file definition for one camera
+_MULTICAM_FILE_TEMPLATE = """
+        <file id="file-{n}">
           <name>{file_name}</name>
           <pathurl>{file_uri}</pathurl>
           <rate>
-            <timebase>{self.fps}</timebase>
-            <ntsc>{self.ntsc}</ntsc>
+            <timebase>{fps}</timebase>
+            <ntsc>{ntsc}</ntsc>
           </rate>
-          <duration>{source_duration_frames}</duration>
+          <duration>{source_duration}</duration>"""
+
+_MULTICAM_FILE_TAIL = """
           <timecode>
             <rate>
-              <timebase>{self.fps}</timebase>
-              <ntsc>{self.ntsc}</ntsc>
+              <timebase>{fps}</timebase>
+              <ntsc>{ntsc}</ntsc>
             </rate>
             <string>00:00:00:00</string>
             <frame>0</frame>
@@ -536,11 +382,11 @@ class XMLExporter:
             <video>
               <samplecharacteristics>
                 <rate>
-                  <timebase>{self.fps}</timebase>
-                  <ntsc>{self.ntsc}</ntsc>
+                  <timebase>{fps}</timebase>
+                  <ntsc>{ntsc}</ntsc>
                 </rate>
-                <width>{self.width}</width>
-                <height>{self.height}</height>
+                <width>{width}</width>
+                <height>{height}</height>
                 <anamorphic>FALSE</anamorphic>
                 <pixelaspectratio>square</pixelaspectratio>
                 <fielddominance>none</fielddominance>
@@ -555,43 +401,23 @@ class XMLExporter:
             </audio>
           </media>
         </file>"""
-              except Exception as e:
-                  logger.error(f"Error processing video file {video_path}: {e}")
-                  continue
-          
-          # Create video tracks for each camera with segmented clips
-          video_tracks = ""
-          for i in range(len(video_paths)):
-              # Generate segmented clips for this camera
-              camera_clips = ""
-              timeline_position = 0
-              
-              for seg_index, segment in enumerate(segments):
-                  start_time = getattr(segment, 'start_time', 0.0)
-                  end_time = getattr(segment, 'end_time', start_time + 1.0)
-                  
-                  # Convert to frames
-                  source_in_frames = int(start_time * self.fps)
-                  source_out_frames = int(end_time * self.fps)
-                  duration_frames = source_out_frames - source_in_frames
-                  
-                  if duration_frames <= 0:
-                      continue
-                  
-                  camera_clips += f"""
-                <clipitem id="cam{i+1}-segment-{seg_index+1}">
-                  <name>Camera_{i+1}_Segment_{seg_index+1}</name>
+
+# Multicam: one segment clip on a camera track
+_MULTICAM_CLIP_TEMPLATE = """
+                <clipitem id="cam{camera}-segment-{n}">
+                  <name>Camera_{camera}_Segment_{n}</name>
                   <enabled>TRUE</enabled>
-                  <duration>{duration_frames}</duration>
+                  <duration>{duration}</duration>
                   <rate>
-                    <timebase>{self.fps}</timebase>
-                    <ntsc>{self.ntsc}</ntsc>
+                    <timebase>{fps}</timebase>
+                    <ntsc>{ntsc}</ntsc>
                   </rate>
-                  <start>{timeline_position}</start>
-                  <end>{timeline_position + duration_frames}</end>
-                  <in>{source_in_frames}</in>
-                  <out>{source_out_frames}</out>
-                  <file id="file-{i+1}"/>
+                  <start>{start}</start>
+                  <end>{end}</end>
+                  <in>{source_in}</in>
+                  <out>{source_out}</out>
+                  <file id="file-{camera}"/>"""
+_MULTICAM_CLIP_TAIL = """
                   <sourcetrack>
                     <mediatype>video</mediatype>
                     <trackindex>1</trackindex>
@@ -613,44 +439,23 @@ class XMLExporter:
                     <lut2></lut2>
                   </colorinfo>
                 </clipitem>"""
-                  
-                  timeline_position += duration_frames
-              
-              video_tracks += f"""
-              <track>
-                <enabled>TRUE</enabled>
-                <locked>FALSE</locked>{camera_clips}
-              </track>"""
-          
-          # Create audio track with segmented clips (using first camera)
-          audio_clips = ""
-          timeline_position = 0
-          
-          for seg_index, segment in enumerate(segments):
-              start_time = getattr(segment, 'start_time', 0.0)
-              end_time = getattr(segment, 'end_time', start_time + 1.0)
-              
-              source_in_frames = int(start_time * self.fps)
-              source_out_frames = int(end_time * self.fps)
-              duration_frames = source_out_frames - source_in_frames
-              
-              if duration_frames <= 0:
-                  continue
-              
-              audio_clips += f"""
-                <clipitem id="audio-segment-{seg_index+1}">
-                  <name>Audio_Segment_{seg_index+1}</name>
+
+# Multicam: one audio clip (first camera)
+_MULTICAM_AUDIO_CLIP_TEMPLATE = """
+                <clipitem id="audio-segment-{n}">
+                  <name>Audio_Segment_{n}</name>
                   <enabled>TRUE</enabled>
-                  <duration>{duration_frames}</duration>
+                  <duration>{duration}</duration>
                   <rate>
-                    <timebase>{self.fps}</timebase>
-                    <ntsc>{self.ntsc}</ntsc>
+                    <timebase>{fps}</timebase>
+                    <ntsc>{ntsc}</ntsc>
                   </rate>
-                  <start>{timeline_position}</start>
-                  <end>{timeline_position + duration_frames}</end>
-                  <in>{source_in_frames}</in>
-                  <out>{source_out_frames}</out>
-                  <file id="file-1"/>
+                  <start>{start}</start>
+                  <end>{end}</end>
+                  <in>{source_in}</in>
+                  <out>{source_out}</out>
+                  <file id="file-1"/>"""
+_MULTICAM_AUDIO_CLIP_TAIL = """
                   <sourcetrack>
                     <mediatype>audio</mediatype>
                     <trackindex>1</trackindex>
@@ -665,42 +470,52 @@ class XMLExporter:
                     <originalaudiofilename></originalaudiofilename>
                   </logginginfo>
                 </clipitem>"""
-              
-              timeline_position += duration_frames
-          
-          # Calculate total timeline duration
-          total_timeline_frames = timeline_position
-          
-          return f"""<?xml version="1.0" encoding="UTF-8"?>
+
+# Multicam: document up to the file definitions
+_MULTICAM_HEAD_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
   <!DOCTYPE xmeml>
   <xmeml version="4">
     <project>
       <name>{sequence_name}_Multicam_Project</name>
-      <children>{file_definitions}
+      <children>"""
+
+# Multicam: sequence header, after the file definitions and before the camera tracks
+_MULTICAM_SEQUENCE_TEMPLATE = """
         <sequence id="sequence-1">
           <uuid>{sequence_uuid}</uuid>
           <name>{sequence_name}_Multicam_Timeline</name>
-          <duration>{total_timeline_frames}</duration>
+          <duration>{total_duration}</duration>
           <rate>
-            <timebase>{self.fps}</timebase>
-            <ntsc>{self.ntsc}</ntsc>
+            <timebase>{fps}</timebase>
+            <ntsc>{ntsc}</ntsc>
           </rate>
           <media>
             <video>
               <format>
                 <samplecharacteristics>
                   <rate>
-                    <timebase>{self.fps}</timebase>
-                    <ntsc>{self.ntsc}</ntsc>
+                    <timebase>{fps}</timebase>
+                    <ntsc>{ntsc}</ntsc>
                   </rate>
-                  <width>{self.width}</width>
-                  <height>{self.height}</height>
+                  <width>{width}</width>
+                  <height>{height}</height>
                   <anamorphic>FALSE</anamorphic>
                   <pixelaspectratio>square</pixelaspectratio>
                   <fielddominance>none</fielddominance>
                   <colordepth>24</colordepth>
                 </samplecharacteristics>
-              </format>{video_tracks}
+              </format>"""
+
+# Multicam: opening and closing of one camera track
+_MULTICAM_TRACK_OPEN = """
+              <track>
+                <enabled>TRUE</enabled>
+                <locked>FALSE</locked>"""
+_MULTICAM_TRACK_CLOSE = """
+              </track>"""
+
+# Multicam: between the camera tracks and the audio clips
+_MULTICAM_MIDDLE_TEMPLATE = """
             </video>
             <audio>
               <numOutputChannels>2</numOutputChannels>
@@ -731,14 +546,17 @@ class XMLExporter:
               <track>
                 <enabled>TRUE</enabled>
                 <locked>FALSE</locked>
-                <outputchannelindex>1</outputchannelindex>{audio_clips}
+                <outputchannelindex>1</outputchannelindex>"""
+
+# Multicam: after the audio clips
+_MULTICAM_TAIL_TEMPLATE = """
               </track>
             </audio>
           </media>
           <timecode>
             <rate>
-              <timebase>{self.fps}</timebase>
-              <ntsc>{self.ntsc}</ntsc>
+              <timebase>{fps}</timebase>
+              <ntsc>{ntsc}</ntsc>
             </rate>
             <string>00:00:00:00</string>
             <frame>0</frame>
@@ -757,28 +575,489 @@ class XMLExporter:
       </children>
     </project>
   </xmeml>"""
+
+class XMLExporter:
+    """Enhanced XML exporter with video groups support and better Premiere Pro compatibility"""
+    
+    # Output is written through a buffer this large (bytes)
+    WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Finished exports are kept here, keyed by a hash of everything that shapes the XML.
+    # Bump CACHE_VERSION whenever the generated XML changes for the same inputs.
+    # Least recently used entries are evicted once the cache grows past CACHE_MAX_BYTES.
+    CACHE_DIR = Path.home() / ".cache" / "smart_edit"
+    CACHE_VERSION = 1
+    CACHE_MAX_BYTES = 256 << 20
+    
+    def __init__(self, fps: int = 24, width: int = 1920, height: int = 1080, use_cache: bool = True,
+                 cache_dir: Optional[str] = None):
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        # Use TRUE for NTSC even with 24fps (matches Premiere behavior)
+        self.ntsc = "TRUE" if fps in [24, 30, 60] else "FALSE"
+        
+        # Bake the exporter-wide values into the templates once; only per-clip fields remain
+        self._single_video_clip_template = self._bake_template(_SINGLE_VIDEO_CLIP_TEMPLATE)
+        self._single_audio_clip_template = self._bake_template(_SINGLE_AUDIO_CLIP_TEMPLATE)
+        self._single_cam_head_template = self._bake_template(_SINGLE_CAM_HEAD_TEMPLATE)
+        # The sequence skeleton between and after the clip lists is fixed per exporter - encode it once
+        self._single_cam_middle = self._bake_template(_SINGLE_CAM_MIDDLE_TEMPLATE).encode('utf-8')
+        self._single_cam_tail = self._bake_template(_SINGLE_CAM_TAIL_TEMPLATE).encode('utf-8')
+        self._multicam_file_template = self._bake_template(_MULTICAM_FILE_TEMPLATE)
+        self._multicam_file_tail = self._bake_template(_MULTICAM_FILE_TAIL)
+        self._multicam_clip_template = self._bake_template(_MULTICAM_CLIP_TEMPLATE)
+        self._multicam_audio_clip_template = self._bake_template(_MULTICAM_AUDIO_CLIP_TEMPLATE)
+        self._multicam_head_template = self._bake_template(_MULTICAM_HEAD_TEMPLATE)
+        self._multicam_sequence_template = self._bake_template(_MULTICAM_SEQUENCE_TEMPLATE)
+        self._multicam_middle = self._bake_template(_MULTICAM_MIDDLE_TEMPLATE).encode('utf-8')
+        self._multicam_tail = self._bake_template(_MULTICAM_TAIL_TEMPLATE).encode('utf-8')
+    
+    def _bake_template(self, template: str) -> str:
+        """Fill in fps, NTSC flag and frame size, leaving the per-clip fields for str.format"""
+        return (template.replace("{fps}", str(self.fps))
+                        .replace("{ntsc}", self.ntsc)
+                        .replace("{width}", str(self.width))
+                        .replace("{height}", str(self.height)))
+    
+    def export_script(self, script: GeneratedScript, video_paths: Union[str, List[str]], 
+                     output_path: str, sequence_name: str = "SmartEdit_Timeline", 
+                     video_groups: Optional[Dict[str, List[str]]] = None) -> bool:
+        """
+        Export script to XML with video groups support
+        
+        Args:
+            script: Generated script with segments
+            video_paths: List of video file paths
+            output_path: Output XML file path
+            sequence_name: Name for the sequence
+            video_groups: Dictionary mapping group names to video paths
+                         e.g., {"Single": [path1], "Multicam A": [path2, path3]}
+        """
+        try:
+            # Convert single path to list
+            if isinstance(video_paths, str):
+                video_paths = [video_paths]
+            
+            # Validate inputs
+            if not video_paths:
+                raise ValueError("No video paths provided")
+            
+            # Get segments to export
+            segments = self._get_valid_segments(script)
+            if not segments:
+                raise ValueError("No valid segments to export")
+            
+            logger.info(f"Exporting {len(segments)} segments from {len(video_paths)} video(s)")
+            
+            # If no groups provided, create default grouping
+            if video_groups is None:
+                if len(video_paths) == 1:
+                    video_groups = {"Single": video_paths}
+                else:
+                    video_groups = {"Multicam A": video_paths}
+                    
+            # Log grouping information
+            for group_name, paths in video_groups.items():
+                logger.info(f"Group '{group_name}': {len(paths)} video(s)")
+            
+            # Resolve every path once, up front, so the XML builders stay free of filesystem calls
+            sources = {path: _video_source(path) for paths in video_groups.values() for path in paths}
+            source_groups = {group_name: [sources[path] for path in paths]
+                             for group_name, paths in video_groups.items()}
+            
+            # Unchanged timeline - reuse the previous export
+            cache_key = self._cache_key(segments, source_groups, sequence_name) if self.use_cache else None
+            if cache_key and self._export_from_cache(cache_key, output_path):
+                logger.info(f"✅ XML exported to: {output_path} (cached)")
+                return True
+            
+            # Generate XML based on grouping
+            xml_parts = self._create_grouped_xml(segments, source_groups, sequence_name)
+            
+            # Save to file
+            self._save_xml(xml_parts, output_path)
+            if cache_key:
+                self._store_in_cache(cache_key, xml_parts)
+            logger.info(f"✅ XML exported to: {output_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ XML export failed: {e}")
+            return False
+    
+    def _create_grouped_xml(self, segments: List[ScriptSegment], video_groups: Dict[str, List[_VideoSource]], 
+                           sequence_name: str) -> List[Union[str, bytes]]:
+        """Create XML with proper group handling"""
+        
+        # Determine the export strategy
+        multicam_groups = {k: v for k, v in video_groups.items() if len(v) > 1}
+        single_videos = []
+        for group_name, paths in video_groups.items():
+            if len(paths) == 1:
+                single_videos.extend(paths)
+        
+        if len(multicam_groups) == 1 and not single_videos:
+            # Pure multicam case
+            group_name, videos = next(iter(multicam_groups.items()))
+            logger.info(f"Creating pure multicam XML for group: {group_name}")
+            return self._create_multicam_xml(segments, videos, f"{sequence_name}_{group_name}")
+            
+        elif len(multicam_groups) == 0 and len(single_videos) == 1:
+            # Pure single cam case
+            logger.info("Creating single cam XML")
+            return self._create_single_cam_xml(segments, single_videos[0], sequence_name)
+            
+        else:
+            # Mixed case - create combined timeline
+            logger.info("Creating mixed timeline with multiple groups")
+            return self._create_mixed_xml(segments, video_groups, sequence_name)
+    
+    def _create_mixed_xml(self, segments: List[ScriptSegment], video_groups: Dict[str, List[_VideoSource]], 
+                         sequence_name: str) -> List[Union[str, bytes]]:
+        """Create XML for mixed single and multicam clips"""
+        
+        # For now, flatten all videos into one timeline
+        # This is a simplified approach - full implementation would create 
+        # multicam source clips for grouped videos
+        all_videos = []
+        for group_name, paths in video_groups.items():
+            all_videos.extend(paths)
+        
+        if len(all_videos) == 1:
+            return self._create_single_cam_xml(segments, all_videos[0], sequence_name)
+        else:
+            # Create a basic multicam structure with all videos
+            return self._create_multicam_xml(segments, all_videos, sequence_name)
+    
+    def _get_valid_segments(self, script: GeneratedScript) -> List[ScriptSegment]:
+        """Extract valid segments from script"""
+        
+        if not hasattr(script, 'segments'):
+            logger.error("Script has no segments attribute")
+            return []
+        
+        # Get segments marked to keep
+        segments = []
+        warn_enabled = logger.isEnabledFor(logging.WARNING)
+        for seg in script.segments:
+            if getattr(seg, 'keep', True):  # Default to True if no keep attribute
+                # The frame math reads the times directly, so segments missing either are dropped
+                if not (hasattr(seg, 'start_time') and hasattr(seg, 'end_time')):
+                    if warn_enabled:
+                        logger.warning("Skipping segment without start/end time")
+                    continue
+                start = seg.start_time
+                end = seg.end_time
+                
+                # Validate timing
+                if end > start and (end - start) > 0.1:  # At least 0.1 second
+                    segments.append(seg)
+                elif warn_enabled:
+                    logger.warning("Skipping segment with invalid timing: %ss to %ss", start, end)
+        
+        if not segments and script.segments:
+            logger.warning("No segments marked to keep, using all segments")
+            segments = [seg for seg in script.segments
+                        if hasattr(seg, 'start_time') and hasattr(seg, 'end_time')]
+        
+        return segments
+    
+    def _segment_frames(self, segments: List[ScriptSegment]) -> Tuple[List[Tuple[int, int, int, int, int]], int]:
+        """
+        Convert segment times to frames in a single pass
+        
+        Returns:
+            ([(clip_number, source_in, source_out, duration, timeline_start), ...], total_frames)
+            with segments shorter than one frame left out
+        """
+        fps = self.fps
+        clip_frames = []
+        timeline_position = 0
+        
+        for n, segment in enumerate(segments, 1):
+            start_time = segment.start_time
+            end_time = segment.end_time
+            
+            source_in_frames = int(start_time * fps)
+            source_out_frames = int(end_time * fps)
+            duration_frames = source_out_frames - source_in_frames
+            
+            if duration_frames <= 0:
+                continue
+            
+            clip_frames.append((n, source_in_frames, source_out_frames, duration_frames, timeline_position))
+            timeline_position += duration_frames
+        
+        return clip_frames, timeline_position
+    
+    def _create_single_cam_xml(self, segments: List[ScriptSegment], video: _VideoSource, sequence_name: str) -> List[Union[str, bytes]]:
+        """Generate single camera XML with proper Premiere compatibility, as fragments in document order"""
+        
+        # Prepare video file info
+        if not video.exists:
+            logger.warning("Video file not found: %s", video.path)
+        
+        # User-supplied text is escaped so names containing &, < or > stay valid XML;
+        # file name keeps its extension, the stem is used for clip names
+        file_uri, file_name, file_stem = video.uri, video.name, video.stem
+        sequence_name = escape(sequence_name)
+        
+        # Generate unique IDs
+        sequence_uuid = str(uuid.uuid4())
+        
+        # Calculate total source duration (assuming it's longer than our edit)
+        max_source_time = 0
+        for segment in segments:
+            end_time = segment.end_time
+            max_source_time = max(max_source_time, end_time)
+        
+        source_duration_frames = int((max_source_time + 300) * self.fps)  # Add 5 min buffer
+        
+        # Frame numbers for every clip, computed up front so the loop below only formats
+        clip_frames, total_duration = self._segment_frames(segments)
+        
+        # Generate clips - fragments are collected in lists, one per track
+        video_parts = []
+        audio_parts = []
+        video_template = self._single_video_clip_template
+        audio_template = self._single_audio_clip_template
+        
+        for n, source_in_frames, source_out_frames, duration_frames, timeline_position in clip_frames:
+            # Video and audio clips share the same fields - build them once
+            clip_fields = {
+                'n': n, 'duration': duration_frames,
+                'start': timeline_position, 'end': timeline_position + duration_frames,
+                'source_in': source_in_frames, 'source_out': source_out_frames,
+            }
+            
+            # Video clip with proper structure
+            video_parts.append(video_template.format_map(clip_fields))
+            video_parts.append(_SINGLE_VIDEO_CLIP_TAIL)
+            
+            # Audio clip with proper channel routing
+            audio_parts.append(audio_template.format_map(clip_fields))
+            audio_parts.append(_SINGLE_AUDIO_CLIP_TAIL)
+        
+        # Assemble the document without joining it into one string
+        xml_parts = [self._single_cam_head_template.format(
+            sequence_name=sequence_name,
+            file_stem=file_stem,
+            file_name=file_name,
+            file_uri=file_uri,
+            source_duration=source_duration_frames,
+            sequence_uuid=sequence_uuid,
+            total_duration=total_duration)]
+        xml_parts.extend(video_parts)
+        xml_parts.append(self._single_cam_middle)
+        xml_parts.extend(audio_parts)
+        xml_parts.append(self._single_cam_tail)
+        return xml_parts
+    
+    def _create_multicam_xml(self, segments: List[ScriptSegment], videos: List[_VideoSource], sequence_name: str) -> List[Union[str, bytes]]:
+      """Generate multicam XML with cuts based on script segments, as fragments in document order"""
+    
+      logger.info(f"Creating multicam XML with {len(videos)} cameras and {len(segments)} cut segments")
+      
+      try:
+          # Calculate source duration
+          max_source_time = 0
+          for segment in segments:
+              end_time = segment.end_time
+              max_source_time = max(max_source_time, end_time)
+          
+          source_duration_frames = int((max_source_time + 300) * self.fps)  # Add 5 min buffer
+          sequence_uuid = str(uuid.uuid4())
+          xml_sequence_name = escape(sequence_name)
+          
+          # Create file definitions for all cameras
+          file_parts = []
+          for i, video in enumerate(videos):
+              try:
+                  if not video.exists:
+                      logger.warning("Video file not found: %s", video.path)
+                      continue
+                  
+                  file_parts.append(self._multicam_file_template.format(
+                      n=i + 1, file_name=video.name, file_uri=video.uri,
+                      source_duration=source_duration_frames))
+                  file_parts.append(self._multicam_file_tail)
+              except Exception as e:
+                  logger.error(f"Error processing video file {video.path}: {e}")
+                  continue
+          
+          # Every camera and the audio track cut at the same frames - compute them once
+          clip_frames, total_timeline_frames = self._segment_frames(segments)
+          
+          # Create video tracks for each camera with segmented clips
+          track_parts = []
+          clip_template = self._multicam_clip_template
+          for i in range(len(videos)):
+              track_parts.append(_MULTICAM_TRACK_OPEN)
+              for n, source_in_frames, source_out_frames, duration_frames, timeline_position in clip_frames:
+                  track_parts.append(clip_template.format(
+                      camera=i + 1, n=n, duration=duration_frames,
+                      start=timeline_position, end=timeline_position + duration_frames,
+                      source_in=source_in_frames, source_out=source_out_frames))
+                  track_parts.append(_MULTICAM_CLIP_TAIL)
+              track_parts.append(_MULTICAM_TRACK_CLOSE)
+          
+          # Create audio track with segmented clips (using first camera)
+          audio_parts = []
+          for n, source_in_frames, source_out_frames, duration_frames, timeline_position in clip_frames:
+              audio_parts.append(self._multicam_audio_clip_template.format(
+                  n=n, duration=duration_frames,
+                  start=timeline_position, end=timeline_position + duration_frames,
+                  source_in=source_in_frames, source_out=source_out_frames))
+              audio_parts.append(_MULTICAM_AUDIO_CLIP_TAIL)
+          
+          # Assemble the document without joining it into one string
+          xml_parts = [self._multicam_head_template.format(sequence_name=xml_sequence_name)]
+          xml_parts.extend(file_parts)
+          xml_parts.append(self._multicam_sequence_template.format(
+              sequence_uuid=sequence_uuid,
+              sequence_name=xml_sequence_name,
+              total_duration=total_timeline_frames))
+          xml_parts.extend(track_parts)
+          xml_parts.append(self._multicam_middle)
+          xml_parts.extend(audio_parts)
+          xml_parts.append(self._multicam_tail)
+          return xml_parts
         
       except Exception as e:
           logger.error(f"Error creating multicam XML: {e}")
           # Fall back to single cam
-          return self._create_single_cam_xml(segments, video_paths[0], sequence_name)
+          return self._create_single_cam_xml(segments, videos[0], sequence_name)
+    
+    def _cache_key(self, segments: List[ScriptSegment], video_groups: Dict[str, List[_VideoSource]],
+                   sequence_name: str) -> str:
+        """Hash of segment times, grouped video files, sequence name and format settings"""
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{self.CACHE_VERSION}|{self.fps}|{self.width}|{self.height}|{sequence_name}".encode('utf-8'))
+        for group_name, videos in video_groups.items():
+            key.update(f"|{group_name}".encode('utf-8'))
+            for video in videos:
+                key.update(f"|{video.uri}|{video.exists}".encode('utf-8'))
+        times = [t for seg in segments for t in (seg.start_time, seg.end_time)]
+        key.update(struct.pack(f'{len(times)}d', *times))
+        return key.hexdigest()
+    
+    def _cache_file(self, cache_key: str) -> Path:
+        """Cache location for an export - entries are plain XML whatever the output format"""
+        return self.cache_dir / f"{cache_key}.xml"
+    
+    def _export_from_cache(self, cache_key: str, output_path: str) -> bool:
+        """
+        Write a cached export to output_path with fresh sequence UUIDs, so separate exports
+        never share one; False on a miss or when the cache is unusable
+        """
+        cached_file = self._cache_file(cache_key)
+        meta_file = cached_file.with_name(cached_file.name + ".meta")
+        try:
+            # The sidecar is written last, so a matching one means the cached XML is complete
+            if meta_file.read_text(encoding='utf-8') != cache_key:
+                return False
+            xml_data = _SEQUENCE_UUID.sub(_fresh_uuid, cached_file.read_bytes())
+            self._save_xml([xml_data], output_path)
+            # Mark as recently used for eviction
+            os.utime(cached_file)
+            return True
+        except OSError:
+            return False
     
-    def _save_xml(self, xml_content: str, output_path: str):
-        """Save XML to file"""
+    def _store_in_cache(self, cache_key: str, xml_parts: List[Union[str, bytes]]):
+        """Keep a copy of a fresh export; caching failures never fail the export"""
         try:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+            # Entry first, sidecar last - both swapped in whole, so readers never see a partial file
+            cached_file = self._cache_file(cache_key)
+            with self._atomic_file(cached_file) as dst:
+                for part in xml_parts:
+                    dst.write(part if isinstance(part, bytes) else part.encode('utf-8'))
+            with self._atomic_file(cached_file.with_name(cached_file.name + ".meta")) as meta:
+                meta.write(cache_key.encode('utf-8'))
+            self._evict_cache()
+        except OSError as e:
+            logger.warning("Could not cache XML export: %s", e)
+    
+    def _evict_cache(self):
+        """Delete least recently used cache entries until the cache fits in CACHE_MAX_BYTES"""
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if path.name.endswith((".xml", ".xml.gz")):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.CACHE_MAX_BYTES:
+                break
+            for stale in (path.with_name(path.name + ".meta"), path):
+                try:
+                    stale.unlink()
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+    
+    @contextlib.contextmanager
+    def _atomic_file(self, target: Path):
+        """
+        Binary file handle on a temp file next to target; target is replaced only after
+        the temp file is completely written and synced, and the temp file is removed on failure
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+                if hasattr(os, 'posix_fadvise'):
+                    # Written once and handed to the editor - no need to keep it in page cache
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            os.replace(tmp_file, target)
+        except BaseException:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def _is_gzip(output_path: str) -> bool:
+        return str(output_path).lower().endswith('.gz')
+    
+    def _save_xml(self, xml_parts: List[Union[str, bytes]], output_path: str):
+        """Save XML fragments to file, in order - pre-encoded bytes parts are written as-is, gzipped for *.gz paths"""
+        output_file = Path(output_path)
+        try:
+            # Write to a temp file and swap it in, so a failed write never leaves a truncated XML behind
+            with self._atomic_file(output_file) as f:
+                if self._is_gzip(output_path):
+                    # Repetitive clip markup compresses well; level 1 keeps it cheap
+                    with gzip.GzipFile(filename=output_file.stem, mode='wb', compresslevel=1, fileobj=f) as gz:
+                        for part in xml_parts:
+                            gz.write(part if isinstance(part, bytes) else part.encode('utf-8'))
+                else:
+                    for part in xml_parts:
+                        f.write(part if isinstance(part, bytes) else part.encode('utf-8'))
         except Exception as e:
             logger.error(f"Failed to save XML file: {e}")
             raise
 
+@functools.lru_cache(maxsize=8)
+def _get_exporter(fps: int, use_cache: bool = True) -> XMLExporter:
+    """Shared exporter per frame rate - templates are baked once, not on every export"""
+    return XMLExporter(fps=fps, use_cache=use_cache)
+
 # Enhanced convenience function with video groups support
 def export_script_to_xml(script: GeneratedScript, video_paths: Union[str, List[str]], 
                         output_path: str, fps: int = 24, sequence_name: str = "SmartEdit",
-                        video_groups: Optional[Dict[str, List[str]]] = None) -> bool:
+                        video_groups: Optional[Dict[str, List[str]]] = None, use_cache: bool = True) -> bool:
     """
     Export script to XML with video groups support and better Premiere compatibility
     
@@ -790,10 +1069,36 @@ def export_script_to_xml(script: GeneratedScript, video_paths: Union[str, List[s
         sequence_name: Name for the sequence
         video_groups: Dictionary mapping group names to video paths
                      e.g., {"Single": [path1], "Multicam A": [path2, path3]}
+        use_cache: Reuse/keep copies of exports under XMLExporter.CACHE_DIR (default True)
     """
-    exporter = XMLExporter(fps=fps)
+    exporter = _get_exporter(fps, use_cache)
     return exporter.export_script(script, video_paths, output_path, sequence_name, video_groups)
 
+def _export_one(job: Tuple[GeneratedScript, Union[str, List[str]], str], fps: int, use_cache: bool = True) -> bool:
+    """Export a single (script, video_paths, output_path) job - runs in a worker process"""
+    script, video_paths, output_path = job
+    return export_script_to_xml(script, video_paths, output_path, fps=fps, use_cache=use_cache)
+
+def export_scripts_batch(jobs: List[Tuple[GeneratedScript, Union[str, List[str]], str]], 
+                         fps: int = 24, max_workers: Optional[int] = None, use_cache: bool = True) -> List[bool]:
+    """
+    Export many scripts to XML in parallel worker processes
+    
+    Args:
+        jobs: (script, video_paths, output_path) tuples
+        fps: Frame rate (default 24)
+        max_workers: Number of worker processes (default os.cpu_count())
+        use_cache: Reuse/keep copies of exports under XMLExporter.CACHE_DIR (default True)
+    
+    Returns:
+        Success flag for each job, in order
+    """
+    if len(jobs) <= 1:
+        return [_export_one(job, fps, use_cache) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_export_one, jobs, [fps] * len(jobs), [use_cache] * len(jobs)))
+
 # Example usage
 if __name__ == "__main__":
     print("Enhanced XML Export Module - Now with Video Groups Support!")
@@ -0,0 +1,234 @@
+"""
+Test suite for xml_export.py features
+
+Tests the XML output cache, XML escaping, batch export, gzipped output
+and segment validation.
+"""
+
+import os
+import re
+import gzip
+import shutil
+import tempfile
+import unittest
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock, patch
+
+# Import the module to test
+import sys
+
+# Get the directory containing this test file
+test_dir = os.path.dirname(os.path.abspath(__file__))
+# Get the project root directory (parent of tests)
+project_root = os.path.dirname(test_dir)
+# Add smart_edit directory to Python path
+smart_edit_path = os.path.join(project_root, 'smart_edit')
+sys.path.insert(0, smart_edit_path)
+
+import xml_export
+from xml_export import XMLExporter, export_scripts_batch
+
+# Minimal script objects - the exporter only reads segment times and keep flags
+@dataclass
+class FakeSegment:
+    start_time: float
+    end_time: float
+    keep: bool = True
+
+@dataclass
+class FakeScript:
+    segments: List[FakeSegment] = field(default_factory=list)
+
+def make_script(*times):
+    return FakeScript([FakeSegment(start, end) for start, end in times])
+
+def strip_uuids(xml_data):
+    return re.sub(rb"<uuid>[^<]*</uuid>", b"<uuid/>", xml_data)
+
+class ExportTestCase(unittest.TestCase):
+    """Temp output and cache directories, so nothing is written into $HOME"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.video_path = os.path.join(self.temp_dir, 'b&c <1>.mp4')
+        Path(self.video_path).write_bytes(b'\x00' * 16)
+
+        patcher = patch.object(XMLExporter, 'CACHE_DIR', Path(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        xml_export._get_exporter.cache_clear()
+        self.addCleanup(xml_export._get_exporter.cache_clear)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def output(self, name):
+        return os.path.join(self.temp_dir, name)
+
+class TestXMLCache(ExportTestCase):
+    """Test the XML output cache"""
+
+    def setUp(self):
+        super().setUp()
+        self.exporter = XMLExporter(cache_dir=self.cache_dir)
+        self.build_xml = Mock(wraps=self.exporter._create_grouped_xml)
+        self.exporter._create_grouped_xml = self.build_xml
+
+    def test_miss_writes_entry_and_sidecar(self):
+        """Test that a miss builds the XML and stores it with a .meta sidecar"""
+        output_path = self.output('first.xml')
+        self.assertTrue(self.exporter.export_script(make_script((0.0, 2.0)), self.video_path, output_path))
+
+        self.assertEqual(self.build_xml.call_count, 1)
+        entries = sorted(os.listdir(self.cache_dir))
+        self.assertEqual(len(entries), 2)
+        cached_name, meta_name = entries
+        self.assertEqual(meta_name, cached_name + '.meta')
+        self.assertEqual(Path(self.cache_dir, meta_name).read_text(encoding='utf-8'),
+                         cached_name[:-len('.xml')])
+        self.assertEqual(Path(self.cache_dir, cached_name).read_bytes(), Path(output_path).read_bytes())
+
+    def test_hit_copies_cached_output(self):
+        """Test that the same inputs are served from the cache"""
+        script = make_script((0.0, 2.0))
+        self.exporter.export_script(script, self.video_path, self.output('first.xml'))
+        self.assertTrue(self.exporter.export_script(script, self.video_path, self.output('second.xml')))
+
+        self.assertEqual(self.build_xml.call_count, 1)
+        self.assertEqual(strip_uuids(Path(self.output('second.xml')).read_bytes()),
+                         strip_uuids(Path(self.output('first.xml')).read_bytes()))
+
+    def test_hit_gets_fresh_sequence_uuid(self):
+        """Test that separate exports of the same script never share a sequence UUID"""
+        script = make_script((0.0, 2.0))
+        self.exporter.export_script(script, self.video_path, self.output('first.xml'))
+        self.exporter.export_script(script, self.video_path, self.output('second.xml'))
+
+        self.assertEqual(self.build_xml.call_count, 1)
+        first_uuids = [e.text for e in ET.parse(self.output('first.xml')).getroot().iter('uuid')]
+        second_uuids = [e.text for e in ET.parse(self.output('second.xml')).getroot().iter('uuid')]
+        self.assertEqual(len(first_uuids), 1)
+        self.assertEqual(len(second_uuids), 1)
+        self.assertNotEqual(first_uuids, second_uuids)
+
+    def test_gz_output_hits_plain_entry(self):
+        """Test that a .gz export of a cached script is compressed from the cached XML"""
+        script = make_script((0.0, 2.0))
+        self.exporter.export_script(script, self.video_path, self.output('first.xml'))
+        self.assertTrue(self.exporter.export_script(script, self.video_path, self.output('second.xml.gz')))
+
+        self.assertEqual(self.build_xml.call_count, 1)
+        with gzip.open(self.output('second.xml.gz'), 'rb') as f:
+            self.assertEqual(strip_uuids(f.read()), strip_uuids(Path(self.output('first.xml')).read_bytes()))
+
+    def test_changed_inputs_miss(self):
+        """Test that different segments or sequence names are not cache hits"""
+        self.exporter.export_script(make_script((0.0, 2.0)), self.video_path, self.output('a.xml'))
+        self.exporter.export_script(make_script((0.0, 2.5)), self.video_path, self.output('b.xml'))
+        self.exporter.export_script(make_script((0.0, 2.0)), self.video_path, self.output('c.xml'),
+                                    sequence_name='Other')
+
+        self.assertEqual(self.build_xml.call_count, 3)
+
+    def test_mismatched_sidecar_is_a_miss(self):
+        """Test that an entry without a matching sidecar is rebuilt"""
+        script = make_script((0.0, 2.0))
+        self.exporter.export_script(script, self.video_path, self.output('first.xml'))
+        meta_file = next(Path(self.cache_dir).glob('*.meta'))
+        meta_file.write_text('stale', encoding='utf-8')
+
+        self.assertTrue(self.exporter.export_script(script, self.video_path, self.output('second.xml')))
+        self.assertEqual(self.build_xml.call_count, 2)
+
+    def test_eviction_bounds_cache(self):
+        """Test that old entries are evicted once the cache exceeds its size limit"""
+        self.exporter.CACHE_MAX_BYTES = 1
+        self.exporter.export_script(make_script((0.0, 2.0)), self.video_path, self.output('a.xml'))
+
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertTrue(os.path.exists(self.output('a.xml')))
+
+class TestXMLEscaping(ExportTestCase):
+    """Test that names, URIs and sequence names are XML-escaped"""
+
+    def test_special_characters_produce_valid_xml(self):
+        """Test export with &, < and > in file and sequence names"""
+        exporter = XMLExporter(cache_dir=self.cache_dir)
+        output_path = self.output('escaped.xml')
+
+        self.assertTrue(exporter.export_script(make_script((0.0, 2.0)), self.video_path,
+                                               output_path, sequence_name='Cut & <Final>'))
+
+        root = ET.parse(output_path).getroot()
+        names = {element.text for element in root.iter('name')}
+        self.assertIn('Cut & <Final>', names)
+        self.assertIn('b&c <1>.mp4', names)
+
+        pathurls = [element.text for element in root.iter('pathurl')]
+        self.assertTrue(pathurls)
+        self.assertEqual(pathurls[0], Path(self.video_path).absolute().as_uri())
+
+class TestBatchExport(ExportTestCase):
+    """Test process-pool batch export"""
+
+    def test_batch_export_in_order(self):
+        """Test that every job is exported and results keep job order"""
+        jobs = [(make_script((0.0, 1.0 + i)), self.video_path, self.output(f'batch_{i}.xml'))
+                for i in range(3)]
+        jobs.append((make_script(), self.video_path, self.output('empty.xml')))
+
+        results = export_scripts_batch(jobs, max_workers=2)
+
+        self.assertEqual(results, [True, True, True, False])
+        for i in range(3):
+            ET.parse(self.output(f'batch_{i}.xml'))
+        self.assertFalse(os.path.exists(self.output('empty.xml')))
+
+    def test_batch_export_without_cache(self):
+        """Test that use_cache=False leaves the cache directory untouched"""
+        jobs = [(make_script((0.0, 2.0)), self.video_path, self.output(f'nocache_{i}.xml'))
+                for i in range(2)]
+
+        self.assertEqual(export_scripts_batch(jobs, max_workers=2, use_cache=False), [True, True])
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+class TestGzipOutput(ExportTestCase):
+    """Test gzipped output for .gz paths"""
+
+    def test_gz_output_matches_plain_output(self):
+        """Test that a .gz export decompresses to the plain export"""
+        exporter = XMLExporter(use_cache=False)
+        script = make_script((0.0, 2.0), (3.0, 5.5))
+
+        with patch('xml_export.uuid.uuid4', return_value='fixed-uuid'):
+            self.assertTrue(exporter.export_script(script, self.video_path, self.output('plain.xml')))
+            self.assertTrue(exporter.export_script(script, self.video_path, self.output('packed.xml.gz')))
+
+        with open(self.output('packed.xml.gz'), 'rb') as f:
+            self.assertEqual(f.read(2), b'\x1f\x8b')
+        with gzip.open(self.output('packed.xml.gz'), 'rb') as f:
+            self.assertEqual(f.read(), Path(self.output('plain.xml')).read_bytes())
+
+class TestSegmentValidation(ExportTestCase):
+    """Test that segments without timing attributes are skipped"""
+
+    def test_segment_missing_start_time_is_skipped(self):
+        """Test that a kept segment without start_time doesn't fail the export"""
+        untimed = Mock(spec=['end_time', 'keep'], end_time=5.0, keep=True)
+        script = FakeScript([untimed, FakeSegment(0.0, 2.0)])
+        exporter = XMLExporter(use_cache=False)
+
+        self.assertEqual(exporter._get_valid_segments(script), [script.segments[1]])
+        self.assertTrue(exporter.export_script(script, self.video_path, self.output('untimed.xml')))
+
+if __name__ == '__main__':
+    # Set up logging for tests
+    logging.basicConfig(level=logging.WARNING)
+
+    # Run tests
+    unittest.main(verbosity=2)
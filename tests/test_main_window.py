@@ -0,0 +1,94 @@
+"""
+Test suite for ui/main_window.py
+
+Tests the pickled transcript cache.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Import the module to test
+import sys
+
+# Get the directory containing this test file
+test_dir = os.path.dirname(os.path.abspath(__file__))
+# Get the project root directory (parent of tests)
+project_root = os.path.dirname(test_dir)
+# Add smart_edit directory to Python path
+smart_edit_path = os.path.join(project_root, 'smart_edit')
+sys.path.insert(0, smart_edit_path)
+
+try:
+    from ui import main_window
+except ImportError:  # tkinter not available
+    main_window = None
+
+@unittest.skipIf(main_window is None, "tkinter not available")
+class TestTranscriptCache(unittest.TestCase):
+    """Test the main window's pickled transcript cache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.video_path = os.path.join(self.temp_dir, 'talk.mp4')
+        Path(self.video_path).write_bytes(b'\x00' * 16)
+
+        window_class = main_window.SmartEditMainWindow
+        patcher = patch.object(window_class, 'TRANSCRIPT_CACHE_DIR', Path(self.temp_dir, 'transcripts'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.window = window_class.__new__(window_class)
+
+        self.transcribe_video = Mock(side_effect=lambda path, config: {'video': path, 'segments': [1, 2]})
+        patcher = patch.object(main_window, '_transcription_api',
+                               return_value=(self.transcribe_video, Mock()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_key(self):
+        """Test that the key is stable and follows path, size and mtime"""
+        key = self.window._transcript_cache_key(self.video_path)
+        self.assertEqual(key, self.window._transcript_cache_key(self.video_path))
+
+        other_path = os.path.join(self.temp_dir, 'other.mp4')
+        shutil.copy2(self.video_path, other_path)
+        self.assertNotEqual(key, self.window._transcript_cache_key(other_path))
+
+        stat = os.stat(self.video_path)
+        os.utime(self.video_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertNotEqual(key, self.window._transcript_cache_key(self.video_path))
+
+    def test_miss_then_hit(self):
+        """Test that the second call is served from the pickle cache"""
+        result, cache_hit = self.window._cached_transcribe(self.video_path)
+        self.assertFalse(cache_hit)
+
+        cached_result, cache_hit = self.window._cached_transcribe(self.video_path)
+        self.assertTrue(cache_hit)
+        self.assertEqual(cached_result, result)
+        self.assertEqual(self.transcribe_video.call_count, 1)
+
+        cache_dir = main_window.SmartEditMainWindow.TRANSCRIPT_CACHE_DIR
+        self.assertEqual([p.suffix for p in cache_dir.iterdir()], ['.pkl'])
+
+    def test_force_retranscribes(self):
+        """Test that force skips a cached transcript"""
+        self.window._cached_transcribe(self.video_path)
+        _, cache_hit = self.window._cached_transcribe(self.video_path, force=True)
+
+        self.assertFalse(cache_hit)
+        self.assertEqual(self.transcribe_video.call_count, 2)
+
+if __name__ == '__main__':
+    # Set up logging for tests
+    logging.basicConfig(level=logging.WARNING)
+
+    # Run tests
+    unittest.main(verbosity=2)